@@ -23,26 +23,155 @@ class AnimalShape(Enum):
     DIAMOND = "diamond"
     STAR = "star"
 
+# Enum members, listed once for random.choice
+_ANIMAL_TYPES = list(AnimalType)
+_ANIMAL_SHAPES = list(AnimalShape)
+
+# Small-int ids for hot-path type checks; comparing ints avoids Enum
+# member lookups on every branch
+HERBIVORE_ID, CARNIVORE_ID, OMNIVORE_ID = 0, 1, 2
+_TYPE_IDS = {
+    AnimalType.HERBIVORE: HERBIVORE_ID,
+    AnimalType.CARNIVORE: CARNIVORE_ID,
+    AnimalType.OMNIVORE: OMNIVORE_ID,
+}
+_STATE_DEAD = EntityState.DEAD
+
+# Distances (in tiles) for prey hunting and predator detection
+HUNT_RANGE = 20
+PREDATOR_DETECT_RANGE = 8
+
+# Hot-path random draws go through random.random(), which is a single C
+# call; random.randint/uniform add several layers of Python per draw
+_random = random.random
+
+def _randint(low: int, high: int) -> int:
+    """Random integer in [low, high], like random.randint"""
+    return low + int(_random() * (high - low + 1))
+
+def _uniform(low: float, high: float) -> float:
+    """Random float in [low, high), like random.uniform"""
+    return low + (high - low) * _random()
+
+# Biomes that provide plant food for grazing animals
+PLANT_BIOMES = frozenset(('grassland', 'forest', 'jungle'))
+
+# How far (in tiles) animals look for plant food
+PLANT_SEARCH_RANGE = 14
+
+class PlantGrid:
+    """Fixed-cell grid index over plant-bearing tiles for nearest-plant lookups"""
+    
+    CELL_SHIFT = 3  # 8x8 tiles per cell
+    
+    def __init__(self, world_data: Dict[Tuple[int, int], 'Tile']):
+        self.cells: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        shift = self.CELL_SHIFT
+        for (x, y), tile in world_data.items():
+            if tile.biome in PLANT_BIOMES:
+                self.cells.setdefault((x >> shift, y >> shift), []).append((x, y))
+                
+    def nearest(self, cx: int, cy: int, max_range: int) -> Optional[Tuple[int, int]]:
+        """Closest plant tile by Chebyshev distance, excluding (cx, cy) itself"""
+        shift = self.CELL_SHIFT
+        cell_size = 1 << shift
+        cells_get = self.cells.get
+        ccx, ccy = cx >> shift, cy >> shift
+        best = None
+        best_d = max_range + 1
+        
+        # Visit cell rings outward from the query cell; every tile in ring k
+        # is at least (k - 1) * cell_size + 1 tiles away, so stop as soon as
+        # a ring cannot beat the best hit
+        for ring in range((max_range >> shift) + 2):
+            if ring and (ring - 1) * cell_size + 1 >= best_d:
+                break
+            for cell in _ring_cells(ccx, ccy, ring):
+                for pos in cells_get(cell, ()):
+                    d = max(abs(pos[0] - cx), abs(pos[1] - cy))
+                    if 0 < d < best_d:
+                        best = pos
+                        best_d = d
+        return best
+
+def _ring_cells(ccx: int, ccy: int, ring: int) -> List[Tuple[int, int]]:
+    """Cells at exactly Chebyshev distance ring from (ccx, ccy)"""
+    if ring == 0:
+        return [(ccx, ccy)]
+    cells = []
+    for x in range(ccx - ring, ccx + ring + 1):
+        cells.append((x, ccy - ring))
+        cells.append((x, ccy + ring))
+    for y in range(ccy - ring + 1, ccy + ring):
+        cells.append((ccx - ring, y))
+        cells.append((ccx + ring, y))
+    return cells
+
+# Stat ranges per animal type:
+# (health, max_health, hunger, max_hunger, speed, attack, defense)
+# Ranged entries are (low, high) pairs passed to randint/uniform
+_STAT_TABLE = {
+    AnimalType.HERBIVORE: ((30, 60), 60, (0, 30), 100, (0.8, 1.5), (2, 8), (3, 10)),
+    AnimalType.CARNIVORE: ((50, 100), 100, (0, 40), 120, (1.2, 2.0), (15, 30), (8, 15)),
+    AnimalType.OMNIVORE: ((40, 80), 80, (0, 35), 110, (1.0, 1.8), (8, 20), (5, 12)),
+}
+
+# Base color palettes per animal type
+_BASE_COLORS = {
+    # Earth tones for herbivores
+    AnimalType.HERBIVORE: (
+        (139, 69, 19),   # Saddle brown
+        (160, 82, 45),   # Sienna
+        (210, 180, 140), # Tan
+        (244, 164, 96),  # Sandy brown
+        (255, 228, 196), # Bisque
+    ),
+    # Darker colors for carnivores
+    AnimalType.CARNIVORE: (
+        (47, 79, 79),    # Dark slate gray
+        (105, 105, 105), # Dim gray
+        (128, 0, 0),     # Maroon
+        (139, 0, 0),     # Dark red
+        (25, 25, 112),   # Midnight blue
+    ),
+    # Mixed colors for omnivores
+    AnimalType.OMNIVORE: (
+        (85, 107, 47),   # Dark olive green
+        (107, 142, 35),  # Olive drab
+        (184, 134, 11),  # Dark goldenrod
+        (205, 133, 63),  # Peru
+        (160, 82, 45),   # Sienna
+    ),
+}
+
 class Animal(Entity):
     """Animal entity - randomly generated creatures with AI"""
     
+    __slots__ = (
+        'animal_type', '_type_id', 'shape', 'age', 'max_age',
+        'reproduction_timer', 'reproduction_cooldown', 'prey_target',
+        'predator_target', 'fleeing', 'flee_timer', 'population',
+    )
+    
     def __init__(self, entity_id: str, x: float, y: float, animal_type: AnimalType = None):
         super().__init__(entity_id, EntityType.ANIMAL, x, y)
         
         # Randomly generate animal properties if not specified
         if animal_type is None:
-            animal_type = random.choice(list(AnimalType))
+            animal_type = random.choice(_ANIMAL_TYPES)
             
         self.animal_type = animal_type
-        self.shape = random.choice(list(AnimalShape))
+        self._type_id = _TYPE_IDS[animal_type]
+        self.shape = random.choice(_ANIMAL_SHAPES)
         self.age = 0
-        self.max_age = random.randint(50, 200)
+        self.max_age = _randint(50, 200)
         self.reproduction_timer = 0
-        self.reproduction_cooldown = random.randint(30, 120)
+        self.reproduction_cooldown = _randint(30, 120)
         self.prey_target = None
         self.predator_target = None
         self.fleeing = False
         self.flee_timer = 0
+        self.population = None  # Owning AnimalPopulation, set by its add()
         
         # Set stats based on animal type
         self.setup_animal_stats()
@@ -52,84 +181,35 @@ class Animal(Entity):
         
     def setup_animal_stats(self):
         """Set up stats based on animal type"""
-        if self.animal_type == AnimalType.HERBIVORE:
-            self.stats = EntityStats(
-                health=random.randint(30, 60),
-                max_health=60,
-                hunger=random.randint(0, 30),
-                max_hunger=100,
-                speed=random.uniform(0.8, 1.5),
-                attack=random.randint(2, 8),
-                defense=random.randint(3, 10)
-            )
-        elif self.animal_type == AnimalType.CARNIVORE:
-            self.stats = EntityStats(
-                health=random.randint(50, 100),
-                max_health=100,
-                hunger=random.randint(0, 40),
-                max_hunger=120,
-                speed=random.uniform(1.2, 2.0),
-                attack=random.randint(15, 30),
-                defense=random.randint(8, 15)
-            )
-        else:  # OMNIVORE
-            self.stats = EntityStats(
-                health=random.randint(40, 80),
-                max_health=80,
-                hunger=random.randint(0, 35),
-                max_hunger=110,
-                speed=random.uniform(1.0, 1.8),
-                attack=random.randint(8, 20),
-                defense=random.randint(5, 12)
-            )
+        health, max_health, hunger, max_hunger, speed, attack, defense = _STAT_TABLE[self.animal_type]
+        self.stats = EntityStats(
+            health=_randint(*health),
+            max_health=max_health,
+            hunger=_randint(*hunger),
+            max_hunger=max_hunger,
+            speed=_uniform(*speed),
+            attack=_randint(*attack),
+            defense=_randint(*defense)
+        )
             
     def generate_visual_properties(self):
         """Generate random visual properties"""
-        # Generate random color based on animal type
-        if self.animal_type == AnimalType.HERBIVORE:
-            # Earth tones for herbivores
-            base_colors = [
-                (139, 69, 19),   # Saddle brown
-                (160, 82, 45),   # Sienna
-                (210, 180, 140), # Tan
-                (244, 164, 96),  # Sandy brown
-                (255, 228, 196), # Bisque
-            ]
-        elif self.animal_type == AnimalType.CARNIVORE:
-            # Darker colors for carnivores
-            base_colors = [
-                (47, 79, 79),    # Dark slate gray
-                (105, 105, 105), # Dim gray
-                (128, 0, 0),     # Maroon
-                (139, 0, 0),     # Dark red
-                (25, 25, 112),   # Midnight blue
-            ]
-        else:  # OMNIVORE
-            # Mixed colors for omnivores
-            base_colors = [
-                (85, 107, 47),   # Dark olive green
-                (107, 142, 35),  # Olive drab
-                (184, 134, 11),  # Dark goldenrod
-                (205, 133, 63),  # Peru
-                (160, 82, 45),   # Sienna
-            ]
-            
-        # Pick base color and add variation
-        base_color = random.choice(base_colors)
-        variation = random.randint(-30, 30)
+        # Pick base color for the animal type and add variation
+        base_color = random.choice(_BASE_COLORS[self.animal_type])
+        variation = _randint(-30, 30)
         self.color = tuple(max(0, min(255, c + variation)) for c in base_color)
         
         # Random size
-        self.size = random.uniform(0.5, 1.5)
+        self.size = _uniform(0.5, 1.5)
         
-    def update(self, delta_time: float, world_data: Dict[Tuple[int, int], 'Tile'], entities: List['Entity']):
-        """Update animal logic"""
+    def update(self, delta_time: float, world_data: Dict[Tuple[int, int], 'Tile']):
+        """Update animal logic; animals are ticked by their AnimalPopulation"""
         super().update(delta_time, world_data)
         
         # Update age
         self.age += delta_time
         if self.age > self.max_age:
-            self.state = EntityState.DEAD
+            self._die()
             return
             
         # Update hunger
@@ -146,136 +226,121 @@ class Animal(Entity):
                 self.flee_timer = 0
                 
         # Handle current state
-        if self.state == EntityState.DEAD:
+        if self.state is _STATE_DEAD:
             return
         elif self.fleeing:
             self.update_fleeing(delta_time, world_data)
         elif self.is_hungry():
-            self.find_food(entities, world_data)
-        elif self.animal_type == AnimalType.CARNIVORE:
-            self.find_prey(entities)
+            self.find_food()
+        elif self._type_id == CARNIVORE_ID:
+            self.find_prey()
         else:
             self.wander(delta_time, world_data)
             
     def update_fleeing(self, delta_time: float, world_data: Dict[Tuple[int, int], 'Tile']):
         """Update fleeing behavior"""
-        if self.predator_target:
-            # Move away from predator
-            predator_x, predator_y = self.predator_target.get_position()
-            dx = self.x - predator_x
-            dy = self.y - predator_y
+        predator = self.predator_target
+        if predator:
+            # Move away from predator, faster when fleeing
+            dx = self.x - predator.x
+            dy = self.y - predator.y
             
-            # Normalize direction
-            distance = math.sqrt(dx * dx + dy * dy)
-            if distance > 0:
-                # Move away from predator
-                move_distance = self.stats.speed * delta_time * 1.5  # Faster when fleeing
-                self.x += (dx / distance) * move_distance
-                self.y += (dy / distance) * move_distance
+            # The epsilon keeps a zero offset from dividing by zero; dx and
+            # dy are zero then, so the animal simply stays put
+            step = self.stats.speed * delta_time * 1.5 / (math.hypot(dx, dy) + 1e-9)
+            self.x += dx * step
+            self.y += dy * step
                 
-    def find_food(self, entities: List['Entity'], world_data: Dict[Tuple[int, int], 'Tile']):
+    def find_food(self):
         """Find food based on animal type"""
-        if self.animal_type == AnimalType.HERBIVORE:
+        type_id = self._type_id
+        if type_id == HERBIVORE_ID:
             # Look for plants/grass
-            food_pos = self.find_nearest_plant(world_data)
+            food_pos = self.find_nearest_plant()
             if food_pos:
                 self.set_target(food_pos[0], food_pos[1])
                 self.state = EntityState.MOVING
-        elif self.animal_type == AnimalType.CARNIVORE:
+        elif type_id == CARNIVORE_ID:
             # Look for prey
-            prey = self.find_nearest_prey(entities)
+            prey = self.find_nearest_prey(self.population.by_diet[HERBIVORE_ID])
             if prey:
                 self.prey_target = prey
                 self.set_target(prey.x, prey.y)
                 self.state = EntityState.ATTACKING
         else:  # OMNIVORE
             # Try meat first, then plants
-            prey = self.find_nearest_prey(entities)
+            prey = self.find_nearest_prey(self.population.by_diet[HERBIVORE_ID])
             if prey:
                 self.prey_target = prey
                 self.set_target(prey.x, prey.y)
                 self.state = EntityState.ATTACKING
             else:
-                food_pos = self.find_nearest_plant(world_data)
+                food_pos = self.find_nearest_plant()
                 if food_pos:
                     self.set_target(food_pos[0], food_pos[1])
                     self.state = EntityState.MOVING
                     
-    def find_prey(self, entities: List['Entity']):
+    def find_prey(self):
         """Find prey to hunt"""
-        prey = self.find_nearest_prey(entities)
+        prey = self.find_nearest_prey(self.population.by_diet[HERBIVORE_ID])
         if prey:
             self.prey_target = prey
             self.set_target(prey.x, prey.y)
             self.state = EntityState.ATTACKING
             
-    def find_nearest_plant(self, world_data: Dict[Tuple[int, int], 'Tile']) -> Optional[Tuple[int, int]]:
+    def find_nearest_plant(self) -> Optional[Tuple[int, int]]:
         """Find nearest plant food"""
-        current_pos = self.get_grid_position()
-        
-        # Search in expanding circles
-        for distance in range(1, 15):
-            for dx in range(-distance, distance + 1):
-                for dy in range(-distance, distance + 1):
-                    if abs(dx) + abs(dy) == distance:
-                        check_x, check_y = current_pos[0] + dx, current_pos[1] + dy
-                        if (check_x, check_y) in world_data:
-                            tile = world_data[(check_x, check_y)]
-                            if tile.biome in ['grassland', 'forest', 'jungle']:
-                                return (check_x, check_y)
-        return None
+        cx, cy = self.get_grid_position()
+        return self.population.plant_grid.nearest(cx, cy, PLANT_SEARCH_RANGE)
         
-    def find_nearest_prey(self, entities: List['Entity']) -> Optional['Entity']:
-        """Find nearest prey animal"""
+    def find_nearest_prey(self, herbivores: List['Animal']) -> Optional['Animal']:
+        """Find nearest prey animal among the living herbivores of the population"""
         nearest_prey = None
-        nearest_distance = float('inf')
+        nearest_d2 = HUNT_RANGE * HUNT_RANGE  # Within hunting range
+        self_x, self_y = self.x, self.y
         
-        for entity in entities:
-            if (entity.entity_type == EntityType.ANIMAL and 
-                entity != self and 
-                entity.is_alive() and
-                entity.animal_type == AnimalType.HERBIVORE):
-                
-                distance = self.distance_to(entity)
-                if distance < nearest_distance and distance < 20:  # Within hunting range
+        for entity in herbivores:
+            if entity is not self:
+                dx = entity.x - self_x
+                dy = entity.y - self_y
+                d2 = dx * dx + dy * dy
+                if d2 < nearest_d2:
                     nearest_prey = entity
-                    nearest_distance = distance
+                    nearest_d2 = d2
                     
         return nearest_prey
         
     def wander(self, delta_time: float, world_data: Dict[Tuple[int, int], 'Tile']):
         """Wander around randomly"""
-        if random.random() < 0.02:  # 2% chance to change direction
-            current_pos = self.get_grid_position()
+        if _random() < 0.02:  # 2% chance to change direction
+            cx, cy = self.get_grid_position()
+            wget = world_data.get
             
             # Find a random walkable position within 8 tiles
             for _ in range(10):
-                dx = random.randint(-4, 4)
-                dy = random.randint(-4, 4)
-                target_x, target_y = current_pos[0] + dx, current_pos[1] + dy
+                target_x = cx + _randint(-4, 4)
+                target_y = cy + _randint(-4, 4)
                 
-                if (target_x, target_y) in world_data:
-                    tile = world_data[(target_x, target_y)]
+                tile = wget((target_x, target_y))
+                if tile is not None:
                     if tile.biome != 'water' and tile.height <= 2:
                         self.set_target(target_x, target_y)
                         self.state = EntityState.MOVING
                         return
                         
-    def detect_predator(self, entities: List['Entity']):
-        """Detect nearby predators and start fleeing"""
-        for entity in entities:
-            if (entity.entity_type == EntityType.ANIMAL and 
-                entity != self and 
-                entity.is_alive() and
-                entity.animal_type == AnimalType.CARNIVORE):
-                
-                distance = self.distance_to(entity)
-                if distance < 8:  # Detection range
-                    self.predator_target = entity
-                    self.fleeing = True
-                    self.flee_timer = 0
-                    return
-                    
+    def take_damage(self, damage: int):
+        """Take damage, leaving the population when it proves fatal"""
+        super().take_damage(damage)
+        if self.state is _STATE_DEAD:
+            self._die()
+            
+    def _die(self):
+        """Mark the animal dead and drop it from its population"""
+        self.state = EntityState.DEAD
+        population = self.population
+        if population is not None:
+            population.remove(self)
+            
     def attack_prey(self, prey: 'Entity'):
         """Attack prey"""
         if prey and prey.is_alive() and self.distance_to(prey) < 1.0:
@@ -305,9 +370,9 @@ class Animal(Entity):
             
         # Create offspring
         offspring = Animal(
-            entity_id=f"animal_{random.randint(10000, 99999)}",
-            x=self.x + random.uniform(-1, 1),
-            y=self.y + random.uniform(-1, 1),
+            entity_id=f"animal_{_randint(10000, 99999)}",
+            x=self.x + _uniform(-1, 1),
+            y=self.y + _uniform(-1, 1),
             animal_type=self.animal_type
         )
         
@@ -326,4 +391,92 @@ class Animal(Entity):
             'hunger_percent': self.stats.hunger / self.stats.max_hunger,
             'fleeing': self.fleeing,
         })
-        return data 
\ No newline at end of file
+        return data 
+
+class AnimalPopulation:
+    """
+    The animals of one world, with the living ones partitioned by diet so
+    hunters only scan herbivores, and the world's plant index for grazers.
+    Animals join through add() and leave through Animal._die().
+    """
+    
+    def __init__(self, world_data: Dict[Tuple[int, int], 'Tile']):
+        self.world_data = world_data
+        self._plant_grid: Optional[PlantGrid] = None
+        self.animals: List[Animal] = []
+        self.by_diet: Dict[int, List[Animal]] = {
+            HERBIVORE_ID: [],
+            CARNIVORE_ID: [],
+            OMNIVORE_ID: [],
+        }
+        
+    @property
+    def plant_grid(self) -> PlantGrid:
+        """Plant index over world_data, built on first use"""
+        grid = self._plant_grid
+        if grid is None:
+            grid = self._plant_grid = PlantGrid(self.world_data)
+        return grid
+        
+    def add(self, animal: Animal) -> Animal:
+        """Add a living animal to the population"""
+        animal.population = self
+        self.animals.append(animal)
+        self.by_diet[animal._type_id].append(animal)
+        return animal
+        
+    def spawn(self, entity_id: str, x: float, y: float, animal_type: AnimalType = None) -> Animal:
+        """Create an animal at (x, y) and add it to the population"""
+        return self.add(Animal(entity_id, x, y, animal_type))
+        
+    def remove(self, animal: Animal):
+        """Drop an animal from the population"""
+        if animal.population is not self:
+            return
+        animal.population = None
+        self.animals.remove(animal)
+        self.by_diet[animal._type_id].remove(animal)
+        
+    def detect_predators(self):
+        """
+        One predator pass per tick: carnivore positions are collected once,
+        then every herbivore that is not already fleeing takes the nearest
+        carnivore in range as its predator and starts fleeing.
+        """
+        carnivores = [(c.x, c.y, c) for c in self.by_diet[CARNIVORE_ID]]
+        if not carnivores:
+            return
+            
+        detect_d2 = PREDATOR_DETECT_RANGE * PREDATOR_DETECT_RANGE
+        for herbivore in self.by_diet[HERBIVORE_ID]:
+            if herbivore.fleeing:
+                continue
+            hx, hy = herbivore.x, herbivore.y
+            nearest = None
+            nearest_d2 = detect_d2
+            for cx, cy, carnivore in carnivores:
+                dx = cx - hx
+                dy = cy - hy
+                d2 = dx * dx + dy * dy
+                if d2 < nearest_d2:
+                    nearest = carnivore
+                    nearest_d2 = d2
+            if nearest is not None:
+                herbivore.predator_target = nearest
+                herbivore.fleeing = True
+                herbivore.flee_timer = 0
+                
+    def update(self, delta_time: float):
+        """Tick every animal once and add any offspring born this tick"""
+        self.detect_predators()
+        
+        animals = self.animals
+        for animal in animals[:]:
+            # Skip animals killed earlier in this tick
+            if animal.population is self:
+                animal.update(delta_time, self.world_data)
+                
+        for animal in animals[:]:
+            offspring = animal.reproduce()
+            if offspring is not None:
+                self.add(offspring)
@@ -1,8 +1,55 @@
+import itertools
 import math
 import random
 
+# Number of recent direction samples averaged to smooth movement
+DIRECTION_WINDOW = 5
+
+# Round-robin AI scheduling: each animal thinks on one frame out of
+# THINK_BUCKETS, and never more often than MIN_THINK_INTERVAL_MS
+THINK_BUCKETS = 16
+MIN_THINK_INTERVAL_MS = 100
+
+_think_slots = itertools.count()
+
+# Animal missions, stored as AnimalUnit.mission_id and used to index the
+# per-AI handler table
+M_ATTACK, M_FLEE, M_SEEK_FOOD, M_ROAM, M_IDLE = range(5)
+
+
+def nearest_forest_tile(forest_map, x0, x1, y0, y1, qx, qy, max_dist):
+    """
+    Closest forest tile to (qx, qy) inside the half-open window
+    [x0, x1) x [y0, y1), strictly within max_dist, or None.
+    """
+    best_pos = None
+    best_d2 = max_dist * max_dist
+
+    # Visit rows nearest the query first; once a row is farther away
+    # than the best hit so far, no later row can beat it
+    for y in sorted(range(y0, y1), key=lambda row_y: abs(row_y - qy)):
+        dy = y - qy
+        dy2 = dy * dy
+        if dy2 >= best_d2:
+            break
+        for x, cell in enumerate(forest_map[y][x0:x1], x0):
+            if cell > 0:
+                dx = x - qx
+                d2 = dx * dx + dy2
+                if d2 < best_d2:
+                    best_pos = (x, y)
+                    best_d2 = d2
+    return best_pos
+
 
 class AnimalAI:
+    __slots__ = (
+        'animal', 'last_path_update', 'path_update_cooldown',
+        'movement_direction_x', 'movement_direction_y',
+        '_dir_x', '_dir_y', '_dir_head', '_dir_count', '_dir_sx', '_dir_sy',
+        'think_bucket', '_pending_dt', '_mission_handlers',
+    )
+
     def __init__(self, animal_unit):
         self.animal = animal_unit
         
@@ -11,57 +58,58 @@ class AnimalAI:
         self.path_update_cooldown = 2.0  # Only update paths every 2 seconds
         self.movement_direction_x = 0.0  # Track overall movement direction
         self.movement_direction_y = 0.0
-        self.direction_samples = []  # Track recent directions for stability
 
-    def update(self, dt):
+        # Ring buffer of recent directions for stability, with running sums
+        self._dir_x = [0.0] * DIRECTION_WINDOW
+        self._dir_y = [0.0] * DIRECTION_WINDOW
+        self._dir_head = 0
+        self._dir_count = 0
+        self._dir_sx = 0.0
+        self._dir_sy = 0.0
+
+        # Round-robin scheduling state
+        self.think_bucket = next(_think_slots) % THINK_BUCKETS
+        self._pending_dt = 0.0
+
+        # Mission handlers indexed by mission id
+        self._mission_handlers = (
+            animal_unit._attack_logic,
+            self._flee_logic,
+            self._seek_food_logic,
+            self._update_roam,
+            self._think,
+        )
+
+    def update(self):
         """
-        Called every frame from AnimalUnit.update()
+        Run decision making for the frame time accumulated since the last
+        think. AnimalManager.tick_all adds each frame's dt to _pending_dt
+        and advances the attack animation timer, so this is only called
+        on the animal's scheduled frames.
         """
-        seconds = dt * 0.001
-
-        if not self.animal.alive:
+        if not self.animal.alive or self._pending_dt < MIN_THINK_INTERVAL_MS:
             return
+        dt = self._pending_dt
+        self._pending_dt = 0.0
 
         # Update path timing
-        self.last_path_update += seconds
-
-        # Check hunger damage
-        if self.animal.hunger >= 1.0:
-            self.animal.health -= 0.5
-            if self.animal.health <= 0:
-                self.animal._die()
-                return
+        self.last_path_update += dt * 0.001
 
         # Run current mission with consistent timing
-        if self.animal.mission == "ATTACK":
-            self.animal._attack_logic(dt)
-        elif self.animal.mission == "FLEE":
-            self._flee_logic(dt)
-        elif self.animal.mission == "SEEK_FOOD":
-            self._seek_food_logic(dt)
-        elif self.animal.mission == "ROAM":
-            self._update_roam(seconds)
-        else:
-            self._think()
-
-        # Handle attack animation timer
-        if self.animal.in_attack_animation:
-            self.animal.attack_anim_timer -= seconds
-            if self.animal.attack_anim_timer <= 0:
-                self.animal.in_attack_animation = False
-
-    def _think(self):
+        self._mission_handlers[self.animal.mission_id](dt)
+
+    def _think(self, dt=0):
         # If low health, flee from enemies
         if self.animal.health < 3:
             enemy = self._find_nearest_enemy(radius=self.animal.territory_radius)
             if enemy:
                 self.animal.target_unit = enemy
-                self.animal.mission = "FLEE"
+                self.animal.mission_id = M_FLEE
                 return
 
         # Seek food if hungry
         if self.animal.hunger > 0.5:
-            self.animal.mission = "SEEK_FOOD"
+            self.animal.mission_id = M_SEEK_FOOD
             return
 
         # Attack if aggressive
@@ -69,52 +117,34 @@ class AnimalAI:
             enemy = self._find_nearest_enemy(radius=self.animal.territory_radius)
             if enemy:
                 self.animal.target_unit = enemy
-                self.animal.mission = "ATTACK"
+                self.animal.mission_id = M_ATTACK
                 return
 
         # Otherwise roam
-        self.animal.mission = "ROAM"
+        self.animal.mission_id = M_ROAM
 
     def _find_nearest_enemy(self, radius=5):
-        nearest_unit = None
-        nearest_dist = radius + 1
+        animal = self.animal
+        index = animal.scene.animal_manager.spatial_index
+        max_dist = radius + 1
 
         # If carnivore, prefer hunting herbivores first
-        if self.animal.diet == "carnivore":
-            for other in self.animal.scene.animal_manager.animals:
-                if other is self.animal or not other.alive:
-                    continue
-                if other.diet == "herbivore":
-                    dist = math.hypot(
-                        other.x_f - self.animal.x_f,
-                        other.y_f - self.animal.y_f
-                    )
-                    if dist < nearest_dist:
-                        nearest_unit = other
-                        nearest_dist = dist
-            if nearest_unit:
-                return nearest_unit
+        if animal.diet == "carnivore":
+            prey = index.nearest(
+                animal.x_f, animal.y_f, max_dist,
+                lambda other: other is not animal and other.alive
+                and getattr(other, "diet", None) == "herbivore"
+            )
+            if prey:
+                return prey
 
         # Otherwise search all non-same-species units
-        all_units = (
-            self.animal.scene.unit_manager.units +
-            self.animal.scene.animal_manager.animals
+        species_id = animal.species_id
+        return index.nearest(
+            animal.x_f, animal.y_f, max_dist,
+            lambda unit: unit is not animal and unit.alive
+            and getattr(unit, "species_id", None) != species_id
         )
-        for unit in all_units:
-            if unit is self.animal or not unit.alive:
-                continue
-            if getattr(unit, "species_id", None) == self.animal.species_id:
-                continue
-
-            dist = math.hypot(
-                unit.x_f - self.animal.x_f,
-                unit.y_f - self.animal.y_f
-            )
-            if dist < nearest_dist:
-                nearest_unit = unit
-                nearest_dist = dist
-
-        return nearest_unit
 
     def _seek_food_logic(self, dt):
         # Convert dt to seconds consistently
@@ -127,7 +157,7 @@ class AnimalAI:
             
             food_pos = self._find_nearest_food_tile(radius=self.animal.territory_radius * 2)
             if food_pos:
-                path = self.animal.scene.find_path(
+                path = self.animal.scene.find_path_cached(
                     int(round(self.animal.x_f)),
                     int(round(self.animal.y_f)),
                     food_pos[0],
@@ -138,7 +168,7 @@ class AnimalAI:
                     self.animal.path_index = 0
                     self.last_path_update = 0.0
             else:
-                self.animal.mission = "ROAM"
+                self.animal.mission_id = M_ROAM
                 return
 
         # Use consistent movement timing
@@ -148,28 +178,21 @@ class AnimalAI:
             # Eat!
             self.animal.hunger -= 0.4
             self.animal.hunger = max(0, self.animal.hunger)
-            self.animal.mission = "IDLE"
+            self.animal.mission_id = M_IDLE
 
     def _find_nearest_food_tile(self, radius=10):
-        best_pos = None
-        best_dist = radius + 1
-
-        for y in range(
-            max(0, int(self.animal.grid_y - radius)),
-            min(self.animal.scene.map.height, int(self.animal.grid_y + radius))
-        ):
-            for x in range(
-                max(0, int(self.animal.grid_x - radius)),
-                min(self.animal.scene.map.width, int(self.animal.grid_x + radius))
-            ):
-                if self.animal.scene.forest_map[y][x] > 0:
-                    dist = math.hypot(x - self.animal.x_f, y - self.animal.y_f)
-                    if dist < best_dist:
-                        best_pos = (x, y)
-                        best_dist = dist
-        return best_pos
-
-    def _update_roam(self, seconds):
+        animal = self.animal
+        return nearest_forest_tile(
+            animal.scene.forest_map,
+            max(0, int(animal.grid_x - radius)),
+            min(animal.scene.map.width, int(animal.grid_x + radius)),
+            max(0, int(animal.grid_y - radius)),
+            min(animal.scene.map.height, int(animal.grid_y + radius)),
+            animal.x_f, animal.y_f, radius + 1
+        )
+
+    def _update_roam(self, dt):
+        seconds = dt * 0.001
         self.animal.roam_timer += seconds
         
         # Only update roam path if enough time has passed
@@ -191,7 +214,7 @@ class AnimalAI:
                     break
                     
             if chosen:
-                path = self.animal.scene.find_path(
+                path = self.animal.scene.find_path_cached(
                     int(round(self.animal.x_f)),
                     int(round(self.animal.y_f)),
                     chosen[0],
@@ -209,7 +232,7 @@ class AnimalAI:
         seconds = dt * 0.001 if dt > 1 else dt
         
         if not self.animal.target_unit or not self.animal.target_unit.alive:
-            self.animal.mission = "IDLE"
+            self.animal.mission_id = M_IDLE
             return
 
         # Only update flee path occasionally to prevent jittery movement
@@ -227,7 +250,7 @@ class AnimalAI:
             escape_x = max(0, min(self.animal.scene.map.width - 1, escape_x))
             escape_y = max(0, min(self.animal.scene.map.height - 1, escape_y))
 
-            path = self.animal.scene.find_path(
+            path = self.animal.scene.find_path_cached(
                 int(round(self.animal.x_f)),
                 int(round(self.animal.y_f)),
                 int(round(escape_x)),
@@ -242,7 +265,7 @@ class AnimalAI:
         self._stable_move_update(seconds)
 
         if self.animal.path_index >= len(self.animal.path_tiles):
-            self.animal.mission = "IDLE"
+            self.animal.mission_id = M_IDLE
 
     def _stable_move_update(self, seconds):
         """
@@ -254,15 +277,21 @@ class AnimalAI:
             dx = tx - self.animal.x_f
             dy = ty - self.animal.y_f
             
-            # Add to direction samples for smoothing
-            self.direction_samples.append((dx, dy))
-            if len(self.direction_samples) > 5:
-                self.direction_samples.pop(0)
+            # Add to direction samples for smoothing, replacing the oldest
+            head = self._dir_head
+            self._dir_sx += dx - self._dir_x[head]
+            self._dir_sy += dy - self._dir_y[head]
+            self._dir_x[head] = dx
+            self._dir_y[head] = dy
+            self._dir_head = (head + 1) % DIRECTION_WINDOW
+            if self._dir_count < DIRECTION_WINDOW:
+                self._dir_count += 1
             
             # Calculate average direction to smooth out jitter
-            if len(self.direction_samples) >= 3:
-                avg_dx = sum(d[0] for d in self.direction_samples) / len(self.direction_samples)
-                avg_dy = sum(d[1] for d in self.direction_samples) / len(self.direction_samples)
+            count = self._dir_count
+            if count >= 3:
+                avg_dx = self._dir_sx / count
+                avg_dy = self._dir_sy / count
                 
                 # Only update movement direction if change is significant
                 if abs(avg_dx) > 0.5:
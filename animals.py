@@ -4,11 +4,14 @@
 
 import math
 import random
+from collections import OrderedDict
+from operator import attrgetter
 import pygame
 from drop import DropObject
 
 from iso_map import IsoObject, TILE_WIDTH, TILE_HEIGHT
-from animal_ai import AnimalAI
+from animal_ai import AnimalAI, THINK_BUCKETS, M_IDLE
+from spatial_index import ZOrderIndex
 
 STACK_OFFSET = 30
 
@@ -36,25 +39,33 @@ STEP_CYCLE = [(0, 2), (1, 1), (2, 0), (1, 1)]
 MAX_ANIMALS = 500
 MAX_DROPS   = 1000
 
+# Loot rolled on death: (resource, drop chance, min qty, max qty)
+DROP_TABLE = (
+    ("meat",    0.75, 1, 3),
+    ("bones",   0.50, 1, 2),
+    ("leather", 0.40, 1, 1),
+)
+
+# Depth sort key (C-level, unlike a lambda)
+_by_draw_order = attrgetter('draw_order')
+
+# Camera zoom changes smaller than this keep the current sprite scale
+ZOOM_RESCALE_EPSILON = 0.02
+
 ##########################################################
 # UTILITY
 ##########################################################
-def _colorize_surface(orig_surf, color):
-    surf = pygame.Surface(orig_surf.get_size(), pygame.SRCALPHA)
-    w, h = orig_surf.get_size()
-    for x in range(w):
-        for y in range(h):
-            px = orig_surf.get_at((x, y))
-            if px.a:
-                surf.set_at((x, y), (color[0], color[1], color[2], px.a))
-    return surf
+# 3x3 structuring element for the one-pixel sprite outline
+_OUTLINE_KERNEL = pygame.mask.Mask((3, 3), fill=True)
 
 def _apply_vertical_gradient(surface, base_color, angle_deg):
     if not ENABLE_PSEUDO_3D_SHADING:
         return surface
 
     w, h = surface.get_size()
-    grad = pygame.Surface((w, h), pygame.SRCALPHA)
+    # Keep the source alpha and clear RGB, then add one shade per row
+    grad = surface.copy()
+    grad.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MULT)
     angle_norm = math.cos(math.radians(angle_deg))
     top_b = 1.0 + 0.2 * angle_norm
     bot_b = 1.0 - 0.2 * angle_norm
@@ -62,15 +73,87 @@ def _apply_vertical_gradient(surface, base_color, angle_deg):
         f = y / max(1, h - 1)
         b = top_b * (1 - f) + bot_b * f
         shaded = tuple(min(255, max(0, int(c * b))) for c in base_color)
-        for x in range(w):
-            a = surface.get_at((x, y)).a
-            if a:
-                grad.set_at((x, y), shaded + (a,))
+        grad.fill(shaded + (0,), (0, y, w, 1), special_flags=pygame.BLEND_RGBA_ADD)
     return grad
 
 ##########################################################
 # PIXEL-ANIMAL SPRITE GENERATOR
 ##########################################################
+# Per-style sprite layout, resolved once per species build instead of
+# branching on style_variant for every frame:
+# (body x, head lift, per-STEP_CYCLE (front, back) leg drop)
+STYLE_LAYOUTS = {
+    "normal":    (4,  0, tuple(STEP_CYCLE)),
+    # T-rex: shifted body, shorter front legs, longer back legs
+    "t_rex":     (10, 0, tuple((max(0, max(0, f - 1) - 1), b + 1) for f, b in STEP_CYCLE)),
+    "long_neck": (4,  8, tuple(STEP_CYCLE)),
+}
+
+def _draw_static_parts(surf, body_color, body_x, body_y, body_width, body_height,
+                       leg_thickness, tail_length, spike_count, head_count,
+                       head_radius, has_snout, snout_length, has_wings,
+                       head_lift):
+    """Body, spikes, tail and heads - everything identical across frames"""
+    pygame.draw.rect(surf, body_color, (body_x, body_y, body_width, body_height))
+
+    # Spikes
+    for s_i in range(spike_count):
+        frac = s_i / (spike_count - 1) if spike_count > 1 else 0.5
+        sx = int(body_x + frac * body_width)
+        sy = body_y
+        pygame.draw.polygon(surf, body_color,
+                            [(sx, sy - 3), (sx - 2, sy), (sx + 2, sy)])
+
+    # Tail
+    tail_y = body_y + body_height // 2
+    pygame.draw.line(surf, body_color,
+                     (body_x, tail_y),
+                     (body_x - tail_length, tail_y - 2),
+                     leg_thickness)
+
+    # Heads
+    head_cx = (body_x + body_width // 2) if has_wings else (body_x + body_width + head_radius + 1)
+    base_hcy = body_y + body_height // 2 - head_lift
+    for h in range(head_count):
+        hcy = int(base_hcy + (h - (head_count - 1) / 2) * 2 * head_radius)
+        pygame.draw.circle(surf, body_color, (head_cx, hcy), head_radius)
+
+        # Eye
+        eye_w = max(2, head_radius // 2)
+        eye_b = max(1, eye_w // 2)
+        eye_c = (head_cx + eye_w, hcy - 1)
+        pygame.draw.circle(surf, (255, 255, 255), eye_c, eye_w)
+        pygame.draw.circle(surf, (0, 0, 0), eye_c, eye_b)
+
+        if has_snout:
+            pygame.draw.rect(
+                surf, body_color,
+                (head_cx + head_radius - 1, hcy - head_radius // 2,
+                 snout_length, head_radius))
+
+def _draw_wings(surf, frame_index, body_color, body_x, body_y, body_width, leg_thickness):
+    """Wings, flapping on alternate frames"""
+    flap = (frame_index % 2) * 2
+    lt  = (body_x + 1, body_y)
+    rt  = (body_x + body_width - 1, body_y)
+    lte = (body_x -  8, body_y - 6 - flap)
+    rte = (body_x + body_width + 8, body_y - 6 + flap)
+    pygame.draw.line(surf, body_color, lt,  lte, leg_thickness + 1)
+    pygame.draw.line(surf, body_color, rt,  rte, leg_thickness + 1)
+
+def _draw_legs(surf, front_add, back_add, body_color, body_x, body_y, body_width,
+               body_height, leg_thickness, leg_length):
+    """Legs, dropped by the step cycle offsets for this frame"""
+    ly_top = body_y + body_height
+    legs = [
+        (body_x + 2,              ly_top + leg_length + back_add),
+        (body_x + 5,              ly_top + leg_length + back_add),
+        (body_x + body_width - 2, ly_top + leg_length + front_add),
+        (body_x + body_width - 5, ly_top + leg_length + front_add),
+    ]
+    for lx, ly in legs:
+        pygame.draw.line(surf, body_color, (lx, ly_top), (lx, ly), leg_thickness)
+
 def create_pixel_animal_frames_with_outline(
     body_color=(200, 100, 100), outline_color=(0, 0, 0),
     shadow_color=(0, 0, 0, 100), num_frames=4,
@@ -82,90 +165,44 @@ def create_pixel_animal_frames_with_outline(
     has_snout=False, snout_length=2,
     has_wings=False, style_variant="normal"
 ):
+    body_x, head_lift, leg_drops = STYLE_LAYOUTS.get(style_variant, STYLE_LAYOUTS["normal"])
+    body_y = (height // 2) - (body_height // 2)
+
+    # Body shadow
+    shadow = pygame.Surface((width, height), pygame.SRCALPHA)
+    sh_rect = pygame.Rect(body_x, body_y + body_height + 4, body_width, 4)
+    pygame.draw.ellipse(shadow, shadow_color, sh_rect)
+
+    # Static parts are drawn once; each frame copies them and adds the legs
+    static = pygame.Surface((width, height), pygame.SRCALPHA)
+    _draw_static_parts(static, body_color, body_x, body_y, body_width, body_height,
+                       leg_thickness, tail_length, spike_count, head_count,
+                       head_radius, has_snout, snout_length, has_wings,
+                       head_lift)
+
+    # Frames with the same leg drops and wing pose are pixel-identical
+    # (e.g. the two (1, 1) steps of STEP_CYCLE), so each pose is painted once
+    built = {}
     frames = []
     for i in range(num_frames):
-        front_off, back_off = STEP_CYCLE[i % len(STEP_CYCLE)]
-
-        base   = pygame.Surface((width, height), pygame.SRCALPHA)
-        shadow = pygame.Surface((width, height), pygame.SRCALPHA)
-
-        body_x = 10 if style_variant == "t_rex" else 4
-        if style_variant == "t_rex":
-            front_off = max(0, front_off - 1)
-
-        body_y = (height // 2) - (body_height // 2)
-        pygame.draw.rect(base, body_color, (body_x, body_y, body_width, body_height))
-
-        # Body shadow
-        sh_rect = pygame.Rect(body_x, body_y + body_height + 4, body_width, 4)
-        pygame.draw.ellipse(shadow, shadow_color, sh_rect)
-
-        # Spikes
-        for s_i in range(spike_count):
-            frac = s_i / (spike_count - 1) if spike_count > 1 else 0.5
-            sx = int(body_x + frac * body_width)
-            sy = body_y
-            pygame.draw.polygon(base, body_color,
-                                [(sx, sy - 3), (sx - 2, sy), (sx + 2, sy)])
-
-        # Tail
-        tail_y = body_y + body_height // 2
-        pygame.draw.line(base, body_color,
-                         (body_x, tail_y),
-                         (body_x - tail_length, tail_y - 2),
-                         leg_thickness)
-
-        # Heads
-        head_cx = (body_x + body_width // 2) if has_wings else (body_x + body_width + head_radius + 1)
-        base_hcy = body_y + body_height // 2 - (8 if style_variant == "long_neck" else 0)
-        for h in range(head_count):
-            hcy = int(base_hcy + (h - (head_count - 1) / 2) * 2 * head_radius)
-            pygame.draw.circle(base, body_color, (head_cx, hcy), head_radius)
-
-            # Eye
-            eye_w = max(2, head_radius // 2)
-            eye_b = max(1, eye_w // 2)
-            eye_c = (head_cx + eye_w, hcy - 1)
-            pygame.draw.circle(base, (255, 255, 255), eye_c, eye_w)
-            pygame.draw.circle(base, (0, 0, 0), eye_c, eye_b)
-
-            if has_snout:
-                pygame.draw.rect(
-                    base, body_color,
-                    (head_cx + head_radius - 1, hcy - head_radius // 2,
-                     snout_length, head_radius))
-
-        # Wings
+        front_add, back_add = leg_drops[i % len(leg_drops)]
+        pose = (front_add, back_add, i % 2 if has_wings else 0)
+        if pose in built:
+            frames.append(built[pose])
+            continue
+
+        base = static.copy()
         if has_wings:
-            lt  = (body_x + 1, body_y)
-            rt  = (body_x + body_width - 1, body_y)
-            lte = (body_x -  8, body_y - 6 - (i % 2) * 2)
-            rte = (body_x + body_width + 8, body_y - 6 + (i % 2) * 2)
-            pygame.draw.line(base, body_color, lt,  lte, leg_thickness + 1)
-            pygame.draw.line(base, body_color, rt,  rte, leg_thickness + 1)
-
-        # Legs
-        ly_top = body_y + body_height
-        front_add, back_add = front_off, back_off
-        if style_variant == "t_rex":
-            front_add = max(0, front_off - 1)
-            back_add  = back_off + 1
-        legs = [
-            (body_x + 2,              ly_top + leg_length + back_add),
-            (body_x + 5,              ly_top + leg_length + back_add),
-            (body_x + body_width - 2, ly_top + leg_length + front_add),
-            (body_x + body_width - 5, ly_top + leg_length + front_add),
-        ]
-        for lx, ly in legs:
-            pygame.draw.line(base, body_color, (lx, ly_top), (lx, ly), leg_thickness)
+            _draw_wings(base, i, body_color, body_x, body_y, body_width, leg_thickness)
+        _draw_legs(base, front_add, back_add, body_color, body_x, body_y, body_width,
+                   body_height, leg_thickness, leg_length)
 
         # Outline
+        # Dilate the opaque pixels by one in every direction; the convolved
+        # mask is one pixel larger on each side, hence the (-1, -1) blit
+        ring = pygame.mask.from_surface(base, 0).convolve(_OUTLINE_KERNEL)
         outline = pygame.Surface((width, height), pygame.SRCALPHA)
-        for ox in (-1, 0, 1):
-            for oy in (-1, 0, 1):
-                if not (ox or oy):
-                    continue
-                outline.blit(_colorize_surface(base, outline_color), (ox, oy))
+        outline.blit(ring.to_surface(setcolor=outline_color, unsetcolor=(0, 0, 0, 0)), (-1, -1))
         outline.blit(base, (0, 0))
 
         # Final frame
@@ -173,6 +210,7 @@ def create_pixel_animal_frames_with_outline(
         final.blit(shadow, (0, 0))
         final.blit(_apply_vertical_gradient(outline, body_color,
                                             PLANET_LIGHT_ANGLE_DEGREES), (0, 0))
+        built[pose] = final
         frames.append(final)
 
     return frames
@@ -183,6 +221,11 @@ def create_pixel_animal_frames(*a, **kw):
 ##########################################################
 # IRONCLAD ANCHOR POINT CALCULATOR
 ##########################################################
+_surface_bytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+
+# Maps alpha values at or below the anti-aliasing threshold to zero
+_ANCHOR_ALPHA_TABLE = bytes(a if a > 20 else 0 for a in range(256))
+
 def calculate_animal_anchor_point(frame):
     """
     IRONCLAD: Find the exact pixel location where the animal appears within its frame.
@@ -192,45 +235,94 @@ def calculate_animal_anchor_point(frame):
     if not frame:
         return (0, 0)
         
-    width, height = frame.get_size()
-    
-    # Find all non-transparent pixels
-    pixels = []
-    for y in range(height):
-        for x in range(width):
-            pixel = frame.get_at((x, y))
-            if pixel.a > 20:  # Non-transparent pixel (with anti-aliasing threshold)
-                pixels.append((x, y))
-    
-    if not pixels:
+    # Only the box around pixels above the anti-aliasing threshold can
+    # carry weight; large frames are mostly transparent margin
+    bounds = frame.get_bounding_rect(min_alpha=21)
+    if not bounds.width or not bounds.height:
+        width, height = frame.get_size()
         return (width // 2, height // 2)  # Fallback to frame center
+    width = bounds.width
     
-    # Calculate weighted center based on actual pixel density
-    # This gives us the visual center of mass of the animal
-    total_weight = 0
-    weighted_x = 0
-    weighted_y = 0
+    # Alpha channel as raw bytes, with anti-aliasing fringe (<= 20) zeroed
+    alpha = _surface_bytes(frame.subsurface(bounds), "RGBA")[3::4].translate(_ANCHOR_ALPHA_TABLE)
     
-    for x, y in pixels:
-        # Weight pixels near the center more heavily (body vs extremities)
-        weight = frame.get_at((x, y)).a / 255.0  # Use alpha as weight
-        weighted_x += x * weight
-        weighted_y += y * weight
-        total_weight += weight
+    # Alpha-weighted centre of mass: summing each row and column slice
+    # runs in C, leaving only width + height Python iterations
+    total_weight = sum(alpha)
+    weighted_x = sum(x * sum(alpha[x::width]) for x in range(width))
+    weighted_y = sum(y * sum(alpha[y * width:(y + 1) * width]) for y in range(bounds.height))
     
-    if total_weight > 0:
-        anchor_x = weighted_x / total_weight
-        anchor_y = weighted_y / total_weight
+    return (bounds.x + weighted_x / total_weight, bounds.y + weighted_y / total_weight)
+
+def _on_screen(blit_args, screen_w, screen_h):
+    """True if a (frame, (x, y)) blit overlaps the screen_w x screen_h viewport"""
+    frame, (x, y) = blit_args
+    return (x < screen_w and y < screen_h and
+            x + frame.get_width() > 0 and y + frame.get_height() > 0)
+
+def _terrain_height_lookup(scene):
+    """scene.terrain.get_height_at when layered terrain is active, else None"""
+    if getattr(scene, 'use_layered_terrain', False) and hasattr(scene, 'terrain'):
+        return scene.terrain.get_height_at
+    return None
+
+##########################################################
+# PER-SPECIES FRAME CACHES
+##########################################################
+# Animals of one species share the same original frame list, so anchors
+# and scaled/flipped frames are computed once per (frames, zoom) and
+# shared by every animal that uses them. Entries hold the frame list so
+# its id() cannot be reused while cached.
+ANCHOR_CACHE_SIZE       = 64
+SCALED_FRAME_CACHE_SIZE = 512
+
+_anchor_cache       = OrderedDict()
+_scaled_frame_cache = OrderedDict()
+
+def _frame_anchors(frames):
+    """(anchor_right, anchor_left) for a frame list, computed once"""
+    key = id(frames)
+    entry = _anchor_cache.get(key)
+    if entry is not None and entry[0] is frames:
+        _anchor_cache.move_to_end(key)
+        return entry[1], entry[2]
+
+    anchor_right = calculate_animal_anchor_point(frames[0]) if frames else (0, 0)
+    if frames:
+        # When flipped, the anchor X coordinate is mirrored across the frame center
+        anchor_left = (frames[0].get_width() - anchor_right[0], anchor_right[1])
     else:
-        # Fallback: geometric center of bounding box
-        min_x = min(p[0] for p in pixels)
-        max_x = max(p[0] for p in pixels)
-        min_y = min(p[1] for p in pixels)
-        max_y = max(p[1] for p in pixels)
-        anchor_x = (min_x + max_x) / 2
-        anchor_y = (min_y + max_y) / 2
-    
-    return (anchor_x, anchor_y)
+        anchor_left = anchor_right
+
+    _anchor_cache[key] = (frames, anchor_right, anchor_left)
+    if len(_anchor_cache) > ANCHOR_CACHE_SIZE:
+        _anchor_cache.popitem(last=False)
+    return anchor_right, anchor_left
+
+def _scaled_frames(frames, zoom):
+    """(frames_right, frames_left) for a frame list at zoom, shared and read-only"""
+    zoom = round(zoom, 3)
+    key = (id(frames), zoom)
+    entry = _scaled_frame_cache.get(key)
+    if entry is not None and entry[0] is frames:
+        _scaled_frame_cache.move_to_end(key)
+        return entry[1], entry[2]
+
+    frames_right = [
+        pygame.transform.smoothscale(
+            f,
+            (max(1, int(f.get_width()  * zoom)),
+             max(1, int(f.get_height() * zoom)))
+        )
+        for f in frames
+    ]
+    # Left frames are the scaled right frames flipped
+    frames_left = [pygame.transform.flip(f, True, False) for f in frames_right]
+
+    _scaled_frame_cache[key] = (frames, frames_right, frames_left)
+    if len(_scaled_frame_cache) > SCALED_FRAME_CACHE_SIZE:
+        _scaled_frame_cache.popitem(last=False)
+    return frames_right, frames_left
 
 ##########################################################
 # 3) ANIMAL UNIT - IRONCLAD POSITIONING
@@ -252,24 +344,12 @@ class AnimalUnit(IsoObject):
         self.original_frames = frames
         self.scaled_frames   = frames[:]
         
-        # IRONCLAD: Pre-calculate anchor points for both directions
-        self.anchor_right = calculate_animal_anchor_point(frames[0]) if frames else (0, 0)
-        print(f"[ANCHOR] Animal anchor point: {self.anchor_right}")
-        
-        # PRE-GENERATE both directions with CONSISTENT positioning
-        self.frames_right = frames[:]
-        self.frames_left = [pygame.transform.flip(f, True, False) for f in frames]
-        
-        # CRITICAL: Calculate left anchor point after flipping
-        if self.frames_left:
-            flipped_frame = self.frames_left[0]
-            frame_width = flipped_frame.get_width()
-            # When flipped, the anchor X coordinate is mirrored across the frame center
-            self.anchor_left = (frame_width - self.anchor_right[0], self.anchor_right[1])
-        else:
-            self.anchor_left = self.anchor_right
+        # IRONCLAD: Anchor points for both directions, shared per species
+        self.anchor_right, self.anchor_left = _frame_anchors(frames)
         
-        print(f"[ANCHOR] Right anchor: {self.anchor_right}, Left anchor: {self.anchor_left}")
+        # Both directions are filled in by set_zoom_scale below
+        self.frames_right = frames
+        self.frames_left  = frames
         
         self.current_frame   = 0
         self.facing_left     = False
@@ -318,7 +398,7 @@ class AnimalUnit(IsoObject):
         self.attack_cooldown = 0.0
 
         self.target_unit = None
-        self.mission     = None
+        self.mission_id  = M_IDLE
 
         # Behaviour
         self.hunger              = random.uniform(0, 0.5)
@@ -334,6 +414,11 @@ class AnimalUnit(IsoObject):
 
         self.ai = AnimalAI(self)
         
+        # Effective zoom the current frame lists were scaled for, and the
+        # manager sprite zoom they were last synced to (None: needs a sync)
+        self._frame_zoom = None
+        self._synced_zoom = None
+        
         # CRITICAL: Initialize everything immediately
         self.set_zoom_scale(1.0)
         self.calculate_screen_position(
@@ -346,39 +431,30 @@ class AnimalUnit(IsoObject):
     # Randomised loot table
     # ───────────────────────────────────────────────
     def _roll_drops(self):
-        tbl = {}
-        if random.random() < 0.75:
-            tbl["meat"] = random.randint(1, 3)
-        if random.random() < 0.50:
-            tbl["bones"] = random.randint(1, 2)
-        if random.random() < 0.40:
-            tbl["leather"] = 1
-        return tbl
+        rand = random.random
+        return {
+            resource: low + int(rand() * (high - low + 1))
+            for resource, chance, low, high in DROP_TABLE
+            if rand() < chance
+        }
 
     # ───────────────────────────────────────────────
     # Core update
     # ───────────────────────────────────────────────
     def set_zoom_scale(self, zoom_scale):
-        final_zoom = zoom_scale * self.growth_scale
-        
-        # Update both right and left facing frames
-        self.frames_right = [
-            pygame.transform.smoothscale(
-                f,
-                (max(1, int(f.get_width()  * final_zoom)),
-                 max(1, int(f.get_height() * final_zoom)))
-            )
-            for f in self.original_frames
-        ]
+        # Direct callers bypass the manager's sync tracking
+        self._synced_zoom = None
+        final_zoom = round(zoom_scale * self.growth_scale, 3)
+        if final_zoom == self._frame_zoom:
+            return
+        self._frame_zoom = final_zoom
         
-        # Update left frames by flipping the scaled right frames
-        self.frames_left = [
-            pygame.transform.flip(frame, True, False) 
-            for frame in self.frames_right
-        ]
+        # Both facing directions come from the per-species cache; the lists
+        # are shared, so they must not be modified in place
+        self.frames_right, self.frames_left = _scaled_frames(self.original_frames, final_zoom)
         
         # Update scaled_frames for compatibility
-        self.scaled_frames = self.frames_right[:]
+        self.scaled_frames = self.frames_right
         
         # IRONCLAD: Scale anchor points to match zoom
         self.scaled_anchor_right = (
@@ -390,127 +466,40 @@ class AnimalUnit(IsoObject):
             self.anchor_left[1] * final_zoom
         )
 
-    def update(self, dt):
+    def update(self, dt, think=True):
         if self._is_dead:
             return
 
-        seconds = dt * 0.001
-        if self.growth_scale < 1.0:
-            self.growth_scale = min(self.growth_scale + self.growth_rate * seconds, 1.0)
-
-        # Update direction lock timer
-        if self.direction_lock_timer > 0:
-            self.direction_lock_timer -= seconds
-
-        # REVAMPED MOVEMENT UPDATE - Smooth physics-based movement
-        self._update_smooth_movement(seconds)
+        # Growth, direction lock, hunger damage, the attack animation
+        # timer and smooth movement run in AnimalManager's batched passes
 
-        self.ai.update(dt)
+        if think:
+            self.ai.update()
 
         # Universal death check
         if self.health <= 0:
             self._die()
 
-    # ───────────────────────────────────────────────
-    # REVAMPED MOVEMENT SYSTEM - Simple and smooth
-    # ───────────────────────────────────────────────
-    def _update_smooth_movement(self, seconds):
-        # Update target position based on current path
-        if self.path_tiles and self.path_index < len(self.path_tiles):
-            self.target_x, self.target_y = self.path_tiles[self.path_index]
-            
-            # Check if we're close enough to current waypoint to advance
-            dist_to_target = math.hypot(self.target_x - self.x_f, self.target_y - self.y_f)
-            if dist_to_target < 0.15:
-                self.path_index += 1
-                if self.path_index < len(self.path_tiles):
-                    self.target_x, self.target_y = self.path_tiles[self.path_index]
-        
-        # Calculate desired velocity towards target
-        target_dx = self.target_x - self.x_f
-        target_dy = self.target_y - self.y_f
-        target_distance = math.hypot(target_dx, target_dy)
-        
-        if target_distance > 0.01:
-            # Normalize direction and scale by max speed
-            desired_velocity_x = (target_dx / target_distance) * self.max_speed
-            desired_velocity_y = (target_dy / target_distance) * self.max_speed
-            
-            # SIMPLE DIRECTION LOGIC: Just face the direction you're moving!
-            if self.direction_lock_timer <= 0 and abs(desired_velocity_x) > 0.2:
-                old_facing = self.visual_facing_left
-                
-                if desired_velocity_x < -0.1:
-                    self.visual_facing_left = True
-                elif desired_velocity_x > 0.1:
-                    self.visual_facing_left = False
-                
-                if old_facing != self.visual_facing_left:
-                    self.direction_lock_timer = self.direction_lock_duration
-                    print(f"Animal {getattr(self, 'species_id', 'unknown')} facing {'LEFT' if self.visual_facing_left else 'RIGHT'}")
-            
-            # Smooth velocity interpolation
-            velocity_diff_x = desired_velocity_x - self.velocity_x
-            velocity_diff_y = desired_velocity_y - self.velocity_y
-            
-            max_accel_this_frame = self.acceleration * seconds
-            velocity_change_magnitude = math.hypot(velocity_diff_x, velocity_diff_y)
-            
-            if velocity_change_magnitude > max_accel_this_frame:
-                scale = max_accel_this_frame / velocity_change_magnitude
-                velocity_diff_x *= scale
-                velocity_diff_y *= scale
-            
-            self.velocity_x += velocity_diff_x
-            self.velocity_y += velocity_diff_y
-            
-            # Update animation
-            current_speed = math.hypot(self.velocity_x, self.velocity_y)
-            if current_speed > 0.1:
-                self.animation_timer += seconds * self.animation_speed * current_speed
-                self.current_frame = int(self.animation_timer) % len(self.scaled_frames)
-        else:
-            # Gradually stop when no target
-            self.velocity_x *= (1.0 - seconds * 5.0)
-            self.velocity_y *= (1.0 - seconds * 5.0)
-            
-            if math.hypot(self.velocity_x, self.velocity_y) < 0.05:
-                self.velocity_x = 0.0
-                self.velocity_y = 0.0
-        
-        # Apply velocity to position
-        self.x_f += self.velocity_x * seconds
-        self.y_f += self.velocity_y * seconds
-        
-        # Update grid position and draw order
-        self.grid_x = int(round(self.x_f))
-        self.grid_y = int(round(self.y_f))
-        self.draw_order = (self.grid_x + self.grid_y) * 10 + 2
-        
-        # Update facing for compatibility
-        self.facing_left = self.visual_facing_left
-
     # ───────────────────────────────────────────────
     # Combat and drop spawning (unchanged)
     # ───────────────────────────────────────────────
     def _attack_logic(self, dt):
         if not self.target_unit or not self.target_unit.alive:
-            self.mission = None
+            self.mission_id = M_IDLE
             return
 
-        dist = math.hypot(
-            self.target_unit.x_f - self.x_f,
-            self.target_unit.y_f - self.y_f
-        )
+        dx = self.target_unit.x_f - self.x_f
+        dy = self.target_unit.y_f - self.y_f
 
-        if dist <= self.attack_range:
+        if dx * dx + dy * dy <= self.attack_range * self.attack_range:
             self.attack_cooldown -= dt * 0.001
             if self.attack_cooldown <= 0:
                 self.in_attack_animation = True
                 self.attack_anim_timer   = 0.25
 
                 self.target_unit.health -= self.attack_power
-                print(f"Animal attacks {self.target_unit} for {self.attack_power} dmg")
+                if getattr(self.scene, 'debug_mode', False):
+                    print(f"Animal attacks {self.target_unit} for {self.attack_power} dmg")
 
                 if self.target_unit.health <= 0 and hasattr(self.target_unit, "_die"):
                     self.target_unit._die()
@@ -535,7 +524,8 @@ class AnimalUnit(IsoObject):
                 self.scene.zoom_scale
             )
             self.scene.drops.append(drop_obj)
-            print(f"Spawned {qty} × {resource} at ({victim.grid_x},{victim.grid_y})")
+            if getattr(self.scene, 'debug_mode', False):
+                print(f"Spawned {qty} × {resource} at ({victim.grid_x},{victim.grid_y})")
 
     def _die(self):
         if self._is_dead:
@@ -554,7 +544,7 @@ class AnimalUnit(IsoObject):
         self.path_index = 0
 
     def _update_move(self, seconds):
-        """Legacy method - now handled by _update_smooth_movement"""
+        """Legacy method - now handled by AnimalManager.move_all"""
         pass
 
     # ───────────────────────────────────────────────
@@ -570,63 +560,63 @@ class AnimalUnit(IsoObject):
         iso_y = (self.x_f + self.y_f) * (TILE_HEIGHT // 2) * zoom_scale
         
         # Add terrain height offset if using layered terrain
-        terrain_height_offset = 0
-        if hasattr(self.scene, 'use_layered_terrain') and self.scene.use_layered_terrain:
-            if hasattr(self.scene, 'terrain'):
-                try:
-                    terrain_height = self.scene.terrain.get_height_at(self.grid_x, self.grid_y)
-                    terrain_height_offset = terrain_height * 16 * zoom_scale
-                except:
-                    terrain_height_offset = 0
+        height_at = _terrain_height_lookup(self.scene)
+        if height_at is not None:
+            iso_y -= height_at(self.grid_x, self.grid_y) * 16 * zoom_scale
         
+        self._set_screen_position(int(iso_x + cam_x), int(iso_y + cam_y))
+
+    def _set_screen_position(self, screen_x, screen_y):
         # IRONCLAD: This is where the animal should visually appear on screen
         # This position NEVER changes regardless of facing direction
-        self.fixed_screen_x = int(iso_x + cam_x)
-        self.fixed_screen_y = int(iso_y + cam_y - terrain_height_offset)
+        self.fixed_screen_x = screen_x
+        self.fixed_screen_y = screen_y
         
         # Set stable position for compatibility
-        self.screen_x = self.fixed_screen_x
-        self.screen_y = self.fixed_screen_y
-        self.stable_screen_x = self.fixed_screen_x
-        self.stable_screen_y = self.fixed_screen_y
+        self.screen_x = screen_x
+        self.screen_y = screen_y
+        self.stable_screen_x = screen_x
+        self.stable_screen_y = screen_y
 
-    def draw(self, surface, tree_images=None, zoom_scale=1.0):
+    def blit_args(self):
         """
-        IRONCLAD DRAWING: Animal always appears at the same screen position
-        regardless of facing direction. This is THE fix for teleporting.
+        IRONCLAD DRAWING: (frame, (x, y)) placing the animal at the same
+        screen position regardless of facing direction, or None when there
+        is nothing to draw. This is THE fix for teleporting.
         """
         if self._is_dead:
-            return
+            return None
 
-        # Choose the correct frame based on direction
+        # Choose the correct frame based on direction; both facings are
+        # prebuilt per species by set_zoom_scale, so nothing flips here
         if self.visual_facing_left:
-            if hasattr(self, 'frames_left') and self.frames_left:
-                frame_surf = self.frames_left[self.current_frame]
-                current_anchor = self.scaled_anchor_left if hasattr(self, 'scaled_anchor_left') else (0, 0)
-            else:
-                frame_surf = pygame.transform.flip(self.scaled_frames[self.current_frame], True, False)
-                current_anchor = (0, 0)  # Fallback
+            frames = self.frames_left
+            current_anchor = self.scaled_anchor_left
         else:
-            if hasattr(self, 'frames_right') and self.frames_right:
-                frame_surf = self.frames_right[self.current_frame]
-                current_anchor = self.scaled_anchor_right if hasattr(self, 'scaled_anchor_right') else (0, 0)
-            else:
-                frame_surf = self.scaled_frames[self.current_frame]
-                current_anchor = (0, 0)  # Fallback
+            frames = self.frames_right
+            current_anchor = self.scaled_anchor_right
 
-        if not frame_surf:
-            return
+        if not frames:
+            return None
+        frame_surf = frames[self.current_frame]
 
         # IRONCLAD POSITIONING: Always position so the animal's anchor point 
         # appears at the fixed screen position, regardless of facing direction
-        frame_w, frame_h = frame_surf.get_width(), frame_surf.get_height()
+        frame_h = frame_surf.get_height()
         
         # Calculate where to draw the frame so the animal appears at fixed_screen position
         draw_x = self.fixed_screen_x - current_anchor[0]
         draw_y = self.fixed_screen_y - current_anchor[1] - int(frame_h * 0.8)  # Slight offset for ground level
         
+        return frame_surf, (draw_x, draw_y)
+
+    def draw(self, surface, tree_images=None, zoom_scale=1.0):
+        args = self.blit_args()
+        if args is None or not _on_screen(args, *surface.get_size()):
+            return
+
         # Draw the frame at the calculated position
-        surface.blit(frame_surf, (draw_x, draw_y))
+        surface.blit(*args)
         
         # DEBUG: Show anchor point (remove this in production)
         if getattr(self.scene, 'debug_mode', False):
@@ -646,17 +636,33 @@ class AnimalManager:
         self.GROWTH_INTERVAL = 30.0
         self.GROWTH_MAX_TIMES = 3
         self.growth_count = 0
+        self.spatial_index = ZOrderIndex()
+        self._tick_bucket = 0
+        self._sprite_zoom = None
+
+        # Depth-sorted copy of self.animals for draw(), re-sorted only when
+        # membership or some animal's draw_order changed
+        self._draw_sorted = []
+        self._draw_source = None
+        self._draw_dirty = True
+
+        # Reused by _double_animals for each growth cycle's offspring
+        self._new_list_scratch = []
 
     def spawn_random_animals(self, override_count=None, override_positions=None):
         if override_positions is not None:
             valid_positions = override_positions
         else:
-            valid_positions = []
-            for y in range(self.scene.map.height):
-                for x in range(self.scene.map.width):
-                    if self.scene.forest_map[y][x] > 0:
-                        if (x, y) not in self.scene.blocked_tiles:
-                            valid_positions.append((x, y))
+            # Forest tiles not blocked by buildings; rows are walked with
+            # enumerate and the set lookup only runs for forest cells
+            width = self.scene.map.width
+            blocked = self.scene.blocked_tiles
+            valid_positions = [
+                (x, y)
+                for y, row in enumerate(self.scene.forest_map[:self.scene.map.height])
+                for x, cell in enumerate(row[:width])
+                if cell > 0 and (x, y) not in blocked
+            ]
 
         if not valid_positions:
             print("No valid tiles to spawn animals.")
@@ -672,6 +678,9 @@ class AnimalManager:
             else:
                 total_species = 12
 
+        # Never spawn past the population cap
+        total_species = min(total_species, MAX_ANIMALS - len(self.animals))
+
         for _ in range(total_species):
             frames, titan = self._build_random_frames()
             speed = 0.5 if titan else 0.8
@@ -772,9 +781,161 @@ class AnimalManager:
         )
         return frames, titan
 
+    def rebuild_spatial_index(self):
+        """Snapshot animal and biped positions for this tick's proximity queries"""
+        units = []
+        unit_manager = getattr(self.scene, 'unit_manager', None)
+        if unit_manager is not None:
+            units = unit_manager.units
+        self.spatial_index.rebuild(
+            u for group in (units, self.animals) for u in group if u.alive
+        )
+
+    def tick_all(self, dt):
+        """
+        Bulk per-tick bookkeeping for every animal in one pass:
+        growth, direction-lock countdown, attack animation, AI time
+        accumulation and hunger damage.
+        """
+        seconds = dt * 0.001
+        for a in self.animals:
+            if not a.alive:
+                continue
+
+            # AI decisions run on scheduled frames only; bank the time
+            a.ai._pending_dt += dt
+
+            if a.in_attack_animation:
+                a.attack_anim_timer -= seconds
+                if a.attack_anim_timer <= 0:
+                    a.in_attack_animation = False
+
+            growth = a.growth_scale
+            if growth < 1.0:
+                a.growth_scale = min(growth + a.growth_rate * seconds, 1.0)
+                a._synced_zoom = None  # frames must follow the new size
+
+            if a.direction_lock_timer > 0:
+                a.direction_lock_timer -= seconds
+
+            # Starving animals lose health every tick
+            if a.hunger >= 1.0:
+                a.health -= 0.5
+                if a.health <= 0:
+                    a._die()
+
+    # ───────────────────────────────────────────────
+    # REVAMPED MOVEMENT SYSTEM - Simple and smooth
+    # ───────────────────────────────────────────────
+    def move_all(self, dt):
+        """
+        Smooth physics-based movement for every animal in one pass:
+        follow the path, steer towards the target, integrate position.
+        """
+        seconds = dt * 0.001
+        hypot = math.hypot
+        stop_damping = 1.0 - seconds * 5.0
+        debug = getattr(self.scene, 'debug_mode', False)
+        for a in self.animals:
+            if a._is_dead:
+                continue
+
+            x, y = a.x_f, a.y_f
+
+            # Update target position based on current path
+            path = a.path_tiles
+            if path and a.path_index < len(path):
+                tx, ty = path[a.path_index]
+
+                # Check if we're close enough to current waypoint to advance
+                if hypot(tx - x, ty - y) < 0.15:
+                    a.path_index += 1
+                    if a.path_index < len(path):
+                        tx, ty = path[a.path_index]
+                a.target_x, a.target_y = tx, ty
+            else:
+                tx, ty = a.target_x, a.target_y
+
+            vx, vy = a.velocity_x, a.velocity_y
+
+            # Calculate desired velocity towards target
+            target_dx = tx - x
+            target_dy = ty - y
+            target_distance = hypot(target_dx, target_dy)
+
+            if target_distance > 0.01:
+                # Normalize direction and scale by max speed
+                speed_scale = a.max_speed / target_distance
+                desired_velocity_x = target_dx * speed_scale
+                desired_velocity_y = target_dy * speed_scale
+
+                # SIMPLE DIRECTION LOGIC: Just face the direction you're moving!
+                # (past the 0.2 dead zone the sign alone decides the facing)
+                if abs(desired_velocity_x) > 0.2 and a.direction_lock_timer <= 0:
+                    new_facing = desired_velocity_x < 0
+                    if new_facing != a.visual_facing_left:
+                        a.visual_facing_left = new_facing
+                        a.direction_lock_timer = a.direction_lock_duration
+                        if debug:
+                            print(f"Animal {getattr(a, 'species_id', 'unknown')} facing {'LEFT' if a.visual_facing_left else 'RIGHT'}")
+
+                # Smooth velocity interpolation
+                velocity_diff_x = desired_velocity_x - vx
+                velocity_diff_y = desired_velocity_y - vy
+
+                max_accel_this_frame = a.acceleration * seconds
+                velocity_change_magnitude = hypot(velocity_diff_x, velocity_diff_y)
+
+                if velocity_change_magnitude > max_accel_this_frame:
+                    scale = max_accel_this_frame / velocity_change_magnitude
+                    velocity_diff_x *= scale
+                    velocity_diff_y *= scale
+
+                vx += velocity_diff_x
+                vy += velocity_diff_y
+
+                # Update animation
+                current_speed = hypot(vx, vy)
+                if current_speed > 0.1:
+                    a.animation_timer += seconds * a.animation_speed * current_speed
+                    a.current_frame = int(a.animation_timer) % len(a.scaled_frames)
+            else:
+                # Gradually stop when no target
+                vx *= stop_damping
+                vy *= stop_damping
+
+                if hypot(vx, vy) < 0.05:
+                    vx = 0.0
+                    vy = 0.0
+
+            a.velocity_x, a.velocity_y = vx, vy
+
+            # Apply velocity to position
+            x += vx * seconds
+            y += vy * seconds
+            a.x_f, a.y_f = x, y
+
+            # Update grid position and draw order
+            gx = a.grid_x = int(round(x))
+            gy = a.grid_y = int(round(y))
+            draw_order = (gx + gy) * 10 + 2
+            if draw_order != a.draw_order:
+                a.draw_order = draw_order
+                self._draw_dirty = True
+
+            # Update facing for compatibility
+            a.facing_left = a.visual_facing_left
+
     def update(self, dt):
+        self.rebuild_spatial_index()
+        self.tick_all(dt)
+        self.move_all(dt)
+
+        # Only one bucket of animals runs its AI this frame; the rest just move
+        bucket = self._tick_bucket
+        self._tick_bucket = (bucket + 1) % THINK_BUCKETS
         for a in self.animals:
-            a.update(dt)
+            a.update(dt, a.ai.think_bucket == bucket)
 
         # SAFETY: cap animal count
         if len(self.animals) > MAX_ANIMALS:
@@ -789,29 +950,29 @@ class AnimalManager:
                 self.growth_count += 1
 
     def _double_animals(self):
-        new_list = []
+        new_list = self._new_list_scratch
+        new_list.clear()
+        # Tiles already holding an animal, for O(1) occupancy checks
+        occupied = {(other.grid_x, other.grid_y) for other in self.animals}
+        founders = self.species_founders
+        # Species whose founder still lives; founders can also die of
+        # hunger without kill_animal, so this is snapshotted per call
+        live_species = {sid for sid, founder in founders.items() if founder.alive}
+        blocked = self.scene.blocked_tiles
+        max_x = self.scene.map.width - 1
+        max_y = self.scene.map.height - 1
+        randint = random.randint
         for a in self.animals:
-            if not a.alive or not a.can_reproduce:
-                continue
-            sid = a.species_id
-            if sid not in self.species_founders:
+            if not a.alive or not a.can_reproduce or a.species_id not in live_species:
                 continue
-            founder = self.species_founders[sid]
-            if not founder.alive:
-                continue
-
-            nx = a.grid_x + random.randint(-2, 2)
-            ny = a.grid_y + random.randint(-2, 2)
-            nx = max(0, min(nx, self.scene.map.width - 1))
-            ny = max(0, min(ny, self.scene.map.height - 1))
 
-            if (nx, ny) in self.scene.blocked_tiles:
-                continue
+            nx = a.grid_x + randint(-2, 2)
+            ny = a.grid_y + randint(-2, 2)
+            nx = max(0, min(nx, max_x))
+            ny = max(0, min(ny, max_y))
 
-            if any(
-                other.grid_x == nx and other.grid_y == ny
-                for other in self.animals
-            ):
+            tile = (nx, ny)
+            if tile in blocked or tile in occupied:
                 continue
 
             baby_scale = 0.3
@@ -825,8 +986,8 @@ class AnimalManager:
                 territory_radius=a.territory_radius,
                 growth_scale=baby_scale,
                 growth_rate=baby_grow,
-                founder_unit=founder,
-                species_id=sid,
+                founder_unit=founders[a.species_id],
+                species_id=a.species_id,
                 can_reproduce=True,
                 titan_mode=a.titan_mode
             )
@@ -835,10 +996,11 @@ class AnimalManager:
             new_list.append(clone)
 
         if len(self.animals) + len(new_list) > MAX_ANIMALS:
-            new_list = new_list[: MAX_ANIMALS - len(self.animals)]
+            del new_list[MAX_ANIMALS - len(self.animals):]
             print("[AnimalManager] Animal doubling capped due to max limit.")
 
         self.animals.extend(new_list)
+        new_list.clear()
 
     def kill_animal(self, animal):
         animal.alive = False
@@ -846,24 +1008,78 @@ class AnimalManager:
         if sid in self.species_founders and self.species_founders[sid] is animal:
             self.species_founders[sid].alive = False
 
+    def _snap_sprite_zoom(self, zoom_scale):
+        """Zoom to scale sprites for; tiny camera zoom changes reuse the last one"""
+        last = self._sprite_zoom
+        if last is None or abs(zoom_scale - last) >= ZOOM_RESCALE_EPSILON:
+            self._sprite_zoom = last = zoom_scale
+        return last
+
     def calculate_screen_positions(self, cam_x, cam_y, zoom_scale):
+        # Rescaling is a no-op unless the zoom or an animal's growth changed
+        sprite_zoom = self._snap_sprite_zoom(zoom_scale)
+
+        # Projection constants and the terrain lookup are resolved once for
+        # the whole batch instead of per animal
+        half_w = (TILE_WIDTH // 2) * zoom_scale
+        half_h = (TILE_HEIGHT // 2) * zoom_scale
+        lift = 16 * zoom_scale
+        height_at = _terrain_height_lookup(self.scene)
         for a in self.animals:
-            a.set_zoom_scale(zoom_scale)
-            a.calculate_screen_position(cam_x, cam_y, zoom_scale)
+            # Only animals that are new, growing or behind a zoom change
+            # need their frames rescaled
+            if a._synced_zoom != sprite_zoom:
+                a.set_zoom_scale(sprite_zoom)
+                a._synced_zoom = sprite_zoom
+            x, y = a.x_f, a.y_f
+            iso_y = (x + y) * half_h
+            if height_at is not None:
+                iso_y -= height_at(a.grid_x, a.grid_y) * lift
+            a._set_screen_position(int((x - y) * half_w + cam_x), int(iso_y + cam_y))
 
     def set_zoom_scale(self, zoom_scale):
+        sprite_zoom = self._snap_sprite_zoom(zoom_scale)
         for a in self.animals:
-            a.set_zoom_scale(zoom_scale)
+            if a._synced_zoom != sprite_zoom:
+                a.set_zoom_scale(sprite_zoom)
+                a._synced_zoom = sprite_zoom
 
     def draw(self, surface, zoom_scale=1.0):
-        for a in sorted(self.animals, key=lambda a: a.draw_order):
-            a.draw(surface, None, zoom_scale)
+        # Gather every animal's blit in depth order and submit them in one call
+        # Animals whose frame lies entirely outside the surface are culled
+        animals = self.animals
+        if self._draw_source is not animals or len(self._draw_sorted) != len(animals):
+            self._draw_sorted = list(animals)
+            self._draw_source = animals
+            self._draw_dirty = True
+        if self._draw_dirty:
+            # Timsort is close to linear on the nearly sorted previous order
+            self._draw_sorted.sort(key=_by_draw_order)
+            self._draw_dirty = False
+        ordered = self._draw_sorted
+        screen_w, screen_h = surface.get_size()
+        batch = [
+            args for args in (a.blit_args() for a in ordered)
+            if args is not None and _on_screen(args, screen_w, screen_h)
+        ]
+        surface.blits(batch, doreturn=False)
+
+        # DEBUG: Show anchor points (remove this in production)
+        if getattr(self.scene, 'debug_mode', False):
+            for a in ordered:
+                if not a._is_dead:
+                    pygame.draw.circle(surface, (255, 0, 0), (a.fixed_screen_x, a.fixed_screen_y), 3)
 
     def add_animal(self, animal):
+        """Add an animal unless the population cap is reached; returns whether it was added"""
+        if len(self.animals) >= MAX_ANIMALS:
+            return False
+
         # CRITICAL: Calculate screen position immediately when adding animals
         animal.calculate_screen_position(
             self.scene.map.camera_offset_x,
             self.scene.map.camera_offset_y,
             self.scene.zoom_scale
         )
-        self.animals.append(animal)
\ No newline at end of file
+        self.animals.append(animal)
+        return True
\ No newline at end of file
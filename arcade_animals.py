@@ -3,10 +3,38 @@
 # Manages animals and wildlife for Arcade
 ##########################################################
 
-import arcade
+import heapq
+import itertools
 import random
 import math
 import time
+from operator import attrgetter
+
+from arcade_utilities import filled_texture
+from spatial_index import SpatialHashGrid
+
+# Half tile extents for the grid -> isometric transform (TILE_WIDTH 64, TILE_HEIGHT 37)
+HALF_TILE_W = 64 // 2
+HALF_TILE_H = 37 // 2
+
+# Tile size of the spatial hash cells used for animal proximity queries
+ANIMAL_GRID_CELL = 4
+
+# The eight neighbouring tile steps for random wandering
+MOVE_DIRECTIONS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+# Diets a randomly created animal can have
+DIETS = ("herbivore", "omnivore", "carnivore")
+
+TWO_PI = 2 * math.pi
+
+# Hot-path binding for the per-move random draws
+_rand = random.random
+
+# Field getters for the get_animal_stats reductions
+_get_alive = attrgetter('alive')
+_get_health = attrgetter('health')
+_get_energy = attrgetter('energy')
 
 def _rand_colour():
     """Generate a random bright color"""
@@ -20,18 +48,109 @@ class ArcadeAnimalManager:
         self.next_species_id = 1
         self.species_founders = {}  # species_id -> founder animal
         self.last_spawn_time = time.time()
+        self.grid = SpatialHashGrid(ANIMAL_GRID_CELL)
+
+        # Managed sprites grouped by species, and counted by diet; kept in
+        # step with the sprite list alongside the spatial grid
+        self._species_index = {}  # species_id -> [animal, ...]
+        self._diet_counts = {}  # diet -> number of animals
+        self._indexed_version = None  # scene.animals_version the indexes match
+
+        # Min-heap of (next move time, tiebreak, animal); an entry is live
+        # only while it matches the animal's time in _move_due
+        self._move_heap = []
+        self._move_due = {}  # id(animal) -> next move time
+        self._move_seq = itertools.count()
+
+        # Cached spawnable-terrain mask, see _spawn_terrain_mask
+        self._spawn_mask = bytearray()
+        self._spawn_mask_src = None
+        self._spawn_mask_size = (0, 0)
+
+    def _sync_indexes(self):
+        """
+        Rebuild the grid and species index if the sprite list changed behind
+        our back (e.g. a save load refilling it); every such change bumps
+        the scene's animals_version
+        """
+        if self._indexed_version != self.scene.animals_version:
+            self._rebuild_indexes(self.scene.animal_sprites)
+
+    def _note_own_change(self):
+        """Bump animals_version for a change the indexes already reflect"""
+        self.scene.animals_version += 1
+        self._indexed_version = self.scene.animals_version
+
+    def _rebuild_indexes(self, animals):
+        """Rebuild the spatial grid, species index and diet counts from scratch"""
+        self.grid.rebuild(animals)
+        self._species_index = {}
+        self._diet_counts = {}
+        self._move_heap = []
+        self._move_due = {}
+        for animal in animals:
+            self._index_animal(animal)
+        self._indexed_version = self.scene.animals_version
+
+    def _index_animal(self, animal):
+        """Add an animal to the species index, diet counts and move schedule"""
+        self._species_index.setdefault(animal.species_id, []).append(animal)
+        diet = animal.diet
+        self._diet_counts[diet] = self._diet_counts.get(diet, 0) + 1
+        self._schedule_move(animal, animal.last_move_time + animal.move_cooldown)
+
+    def _schedule_move(self, animal, due):
+        """Queue an animal's next behaviour step for time due"""
+        self._move_due[id(animal)] = due
+        heapq.heappush(self._move_heap, (due, next(self._move_seq), animal))
+
+    def _unindex_animal(self, animal):
+        """Drop an animal from the species index, diet counts and move schedule"""
+        self._move_due.pop(id(animal), None)
+        species_id = animal.species_id
+        members = self._species_index.get(species_id)
+        if not members or animal not in members:
+            return
+        members.remove(animal)
+        if not members:
+            del self._species_index[species_id]
+        diet = animal.diet
+        self._diet_counts[diet] -= 1
+        if not self._diet_counts[diet]:
+            del self._diet_counts[diet]
+
+    def _place_animal(self, animal, grid_x, grid_y):
+        """Move an animal to a tile, updating its sprite position and grid cell"""
+        old_xy = (animal.grid_x, animal.grid_y)
+        animal.center_x = (grid_x - grid_y) * HALF_TILE_W
+        animal.center_y = (grid_x + grid_y) * HALF_TILE_H
+        animal.grid_x = grid_x
+        animal.grid_y = grid_y
+        self.grid.move(animal, old_xy, (grid_x, grid_y))
 
     def add_animal(self, animal_sprite):
         """Add an animal to management"""
         if animal_sprite not in self.scene.animal_sprites:
+            self._sync_indexes()
             self.scene.animal_sprites.append(animal_sprite)
-        print(f"[ArcadeAnimalManager] Added animal species {getattr(animal_sprite, 'species_id', 'unknown')}")
+            self.grid.insert(animal_sprite)
+            self._index_animal(animal_sprite)
+            self._note_own_change()
+        print(f"[ArcadeAnimalManager] Added animal species {animal_sprite.species_id}")
 
     def remove_animal(self, animal_sprite):
         """Remove an animal from management"""
-        if animal_sprite in self.scene.animal_sprites:
+        self._sync_indexes()
+        try:
+            # remove() does its own search; no separate membership scan
             self.scene.animal_sprites.remove(animal_sprite)
-        print(f"[ArcadeAnimalManager] Removed animal species {getattr(animal_sprite, 'species_id', 'unknown')}")
+        except ValueError:
+            pass
+        else:
+            self.grid.remove(animal_sprite)
+            self._unindex_animal(animal_sprite)
+            self._note_own_change()
+        print(f"[ArcadeAnimalManager] Removed animal species {animal_sprite.species_id}")
 
     def spawn_random_animals(self, count=None, area_center=None, area_radius=None):
         """Spawn random animals on the planet"""
@@ -41,22 +160,13 @@ class ArcadeAnimalManager:
         spawned = 0
         max_attempts = 50
         
-        for _ in range(count):
-            attempts = 0
-            while attempts < max_attempts:
-                # Choose spawn location
-                if area_center and area_radius:
-                    # Spawn in specific area
-                    center_x, center_y = area_center
-                    angle = random.uniform(0, 2 * math.pi)
-                    distance = random.uniform(0, area_radius)
-                    spawn_x = int(center_x + math.cos(angle) * distance)
-                    spawn_y = int(center_y + math.sin(angle) * distance)
-                else:
-                    # Spawn anywhere on planet
-                    spawn_x = random.randint(1, self.scene.terrain_width - 2)
-                    spawn_y = random.randint(1, self.scene.terrain_height - 2)
-                
+        # Draw candidate tiles in batches rather than retrying one tile at
+        # a time; the overall attempt budget matches the old per-animal one
+        budget = count * max_attempts
+        while spawned < count and budget > 0:
+            batch = min(budget, (count - spawned) * 8)
+            budget -= batch
+            for spawn_x, spawn_y in self._sample_spawn_tiles(batch, area_center, area_radius):
                 # Check if location is valid
                 if self._is_valid_spawn_location(spawn_x, spawn_y):
                     # Create animal
@@ -64,188 +174,211 @@ class ArcadeAnimalManager:
                     if animal:
                         self.add_animal(animal)
                         spawned += 1
-                        break
-                
-                attempts += 1
+                        if spawned == count:
+                            break
         
         print(f"[ArcadeAnimalManager] Spawned {spawned} random animals")
         return spawned
 
+    def _sample_disc_tiles(self, n, center, radius):
+        """Draw n random tiles within radius of center"""
+        rand = _rand
+        cos = math.cos
+        sin = math.sin
+        center_x, center_y = center
+        tiles = []
+        for _ in range(n):
+            angle = rand() * TWO_PI
+            distance = rand() * radius
+            tiles.append((int(center_x + cos(angle) * distance),
+                          int(center_y + sin(angle) * distance)))
+        return tiles
+
+    def _sample_spawn_tiles(self, n, area_center=None, area_radius=None):
+        """Draw n candidate spawn tiles, in a disc or anywhere on the planet"""
+        if area_center and area_radius:
+            # Spawn in specific area
+            return self._sample_disc_tiles(n, area_center, area_radius)
+        
+        # Spawn anywhere on planet, away from the map edge
+        rand = _rand
+        span_x = self.scene.terrain_width - 2
+        span_y = self.scene.terrain_height - 2
+        return [(1 + int(rand() * span_x), 1 + int(rand() * span_y)) for _ in range(n)]
+
+    def _spawn_terrain_mask(self):
+        """
+        Row-major bytearray over the terrain, 1 where the tile type allows
+        spawning. Rebuilt only when map_data or the terrain size changes.
+        """
+        scene = self.scene
+        width = scene.terrain_width
+        height = scene.terrain_height
+        if (self._spawn_mask_src is not scene.map_data or
+                self._spawn_mask_size != (width, height)):
+            mask = bytearray(b'\x01') * (width * height)
+            for y, row in enumerate(scene.map_data[:height]):
+                base = y * width
+                for x, tile_type in enumerate(row[:width]):
+                    # Don't spawn in water or void
+                    if tile_type in (2, 5, -1):  # TILE_WATER, TILE_WATERSTACK, void
+                        mask[base + x] = 0
+            self._spawn_mask = mask
+            self._spawn_mask_src = scene.map_data
+            self._spawn_mask_size = (width, height)
+        return self._spawn_mask
+
     def _is_valid_spawn_location(self, grid_x, grid_y):
         """Check if a location is valid for animal spawning"""
-        # Check bounds
-        if not (0 <= grid_x < self.scene.terrain_width and 0 <= grid_y < self.scene.terrain_height):
-            return False
+        mask = self._spawn_terrain_mask()
+        width, height = self._spawn_mask_size
         
-        # Check if blocked
-        if (grid_x, grid_y) in self.scene.blocked_tiles:
+        # Check bounds and terrain type with one byte lookup
+        if not (0 <= grid_x < width and 0 <= grid_y < height and mask[grid_y * width + grid_x]):
             return False
         
-        # Check terrain type
-        if (0 <= grid_y < len(self.scene.map_data) and 
-            0 <= grid_x < len(self.scene.map_data[0])):
-            tile_type = self.scene.map_data[grid_y][grid_x]
-            # Don't spawn in water or void
-            if tile_type in (2, 5, -1):  # TILE_WATER, TILE_WATERSTACK, void
-                return False
-        
-        return True
+        # Check if blocked
+        return (grid_x, grid_y) not in self.scene.blocked_tiles
 
     def _create_random_animal(self, grid_x, grid_y):
         """Create a random animal at the specified location"""
-        try:
-            # Calculate isometric position
-            iso_x = (grid_x - grid_y) * (64 // 2)  # TILE_WIDTH
-            iso_y = (grid_x + grid_y) * (37 // 2)  # TILE_HEIGHT
-            
-            # Create animal sprite
-            from arcade_planet_scene import ArcadeAnimalSprite
-            animal = ArcadeAnimalSprite(iso_x, iso_y, _rand_colour())
-            
-            # Set animal properties
-            animal.grid_x = grid_x
-            animal.grid_y = grid_y
-            animal.species_id = self.next_species_id
-            animal.creation_time = time.time()
-            animal.last_move_time = time.time()
-            animal.move_cooldown = random.uniform(2.0, 5.0)  # Seconds between moves
-            animal.territory_center_x = grid_x
-            animal.territory_center_y = grid_y
-            animal.territory_radius = random.randint(3, 8)
-            animal.diet = random.choice(["herbivore", "omnivore", "carnivore"])
-            animal.aggression = random.uniform(0.0, 0.5)
-            animal.health = 100
-            animal.max_health = 100
-            animal.energy = 100
-            animal.reproduction_cooldown = 0
-            
-            # Create species founder if this is a new species
-            if self.next_species_id not in self.species_founders:
-                self.species_founders[self.next_species_id] = animal
-            
-            self.next_species_id += 1
-            return animal
-            
-        except Exception as e:
-            print(f"[ArcadeAnimalManager] Error creating animal: {e}")
-            return None
+        # Calculate isometric position
+        iso_x = (grid_x - grid_y) * HALF_TILE_W
+        iso_y = (grid_x + grid_y) * HALF_TILE_H
+        
+        # Create animal sprite
+        from arcade_planet_scene import ArcadeAnimalSprite
+        animal = ArcadeAnimalSprite(iso_x, iso_y, _rand_colour())
+        
+        # Set animal properties
+        animal.grid_x = grid_x
+        animal.grid_y = grid_y
+        animal.species_id = self.next_species_id
+        animal.creation_time = time.time()
+        animal.last_move_time = time.time()
+        animal.move_cooldown = random.uniform(2.0, 5.0)  # Seconds between moves
+        animal.territory_center_x = grid_x
+        animal.territory_center_y = grid_y
+        animal.territory_radius = random.randint(3, 8)
+        animal.diet = DIETS[int(_rand() * 3)]
+        animal.aggression = random.uniform(0.0, 0.5)
+        animal.health = 100
+        animal.max_health = 100
+        animal.energy = 100
+        animal.reproduction_cooldown = 0
+        animal.alive = True
+        animal.has_vitals = True
+        
+        # Create species founder if this is a new species
+        if self.next_species_id not in self.species_founders:
+            self.species_founders[self.next_species_id] = animal
+        
+        self.next_species_id += 1
+        return animal
 
     def update(self, dt):
         """Update all animals"""
         current_time = time.time()
+        self._sync_indexes()
         
-        for animal in self.scene.animal_sprites:
-            self._update_animal_behavior(animal, dt, current_time)
+        # Only animals whose move cooldown has run out do any behaviour
+        # work this frame. One error boundary for the whole pass; a failing
+        # animal is reported and skipped until its next turn.
+        sprites = self.scene.animal_sprites
+        behave = self._update_animal_behavior
+        heap = self._move_heap
+        move_due = self._move_due
+        while heap and heap[0][0] < current_time:
+            due, _, animal = heapq.heappop(heap)
+            if move_due.get(id(animal)) != due:
+                continue  # stale entry: rescheduled or no longer managed
+            try:
+                behave(animal, dt, current_time)
+            except Exception as e:
+                print(f"[ArcadeAnimalManager] Error updating animal: {e}")
+            self._schedule_move(animal, max(current_time, animal.last_move_time + animal.move_cooldown))
+        
+        # Energy and health management for every animal in one pass
+        self._update_all_vitals(dt)
         
         # Occasionally spawn new animals
         if current_time - self.last_spawn_time > 30.0:  # Every 30 seconds
-            if len(self.scene.animal_sprites) < 20:  # Max population
+            if len(sprites) < 20:  # Max population
                 self.spawn_random_animals(1)
             self.last_spawn_time = current_time
 
     def _update_animal_behavior(self, animal, dt, current_time):
-        """Update individual animal behavior"""
-        try:
-            # Movement behavior
-            if (current_time - getattr(animal, 'last_move_time', 0) > 
-                getattr(animal, 'move_cooldown', 3.0)):
-                self._move_animal_randomly(animal)
-                animal.last_move_time = current_time
-                animal.move_cooldown = random.uniform(2.0, 5.0)
-            
-            # Energy and health management
-            self._update_animal_vitals(animal, dt)
-            
-            # Territory behavior
-            self._enforce_territory(animal)
-            
-        except Exception as e:
-            print(f"[ArcadeAnimalManager] Error updating animal: {e}")
-
-    def _move_animal_randomly(self, animal):
-        """Move animal randomly within its territory"""
-        try:
-            # Get current grid position
-            current_grid_x = getattr(animal, 'grid_x', 0)
-            current_grid_y = getattr(animal, 'grid_y', 0)
-            
-            # Choose random direction
-            directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
-            dx, dy = random.choice(directions)
-            
-            new_grid_x = current_grid_x + dx
-            new_grid_y = current_grid_y + dy
+        """
+        Update individual animal behavior: a random step within its
+        territory, then a step back towards the territory if it is
+        outside. The animal's position and territory are read once and
+        any move is written back once.
+        """
+        grid_x = start_x = animal.grid_x
+        grid_y = start_y = animal.grid_y
+        center_x = animal.territory_center_x
+        if center_x is not None:  # None: no territory, anywhere goes
+            center_y = animal.territory_center_y
+            radius_sq = animal.territory_radius * animal.territory_radius
+        valid = self._is_valid_spawn_location
+        
+        # Movement behavior
+        if current_time - animal.last_move_time > animal.move_cooldown:
+            dx, dy = MOVE_DIRECTIONS[int(_rand() * 8)]
+            new_x = grid_x + dx
+            new_y = grid_y + dy
             
             # Check if new position is valid and within territory
-            if (self._is_valid_spawn_location(new_grid_x, new_grid_y) and
-                self._is_within_territory(animal, new_grid_x, new_grid_y)):
-                
-                # Calculate new isometric position
-                new_iso_x = (new_grid_x - new_grid_y) * (64 // 2)
-                new_iso_y = (new_grid_x + new_grid_y) * (37 // 2)
-                
-                # Update position
-                animal.center_x = new_iso_x
-                animal.center_y = new_iso_y
-                animal.grid_x = new_grid_x
-                animal.grid_y = new_grid_y
-                
-        except Exception as e:
-            print(f"[ArcadeAnimalManager] Error moving animal: {e}")
-
-    def _is_within_territory(self, animal, grid_x, grid_y):
-        """Check if position is within animal's territory"""
-        territory_center_x = getattr(animal, 'territory_center_x', animal.grid_x)
-        territory_center_y = getattr(animal, 'territory_center_y', animal.grid_y)
-        territory_radius = getattr(animal, 'territory_radius', 5)
+            if valid(new_x, new_y):
+                if center_x is None:
+                    grid_x, grid_y = new_x, new_y
+                else:
+                    off_x = new_x - center_x
+                    off_y = new_y - center_y
+                    if off_x * off_x + off_y * off_y <= radius_sq:
+                        grid_x, grid_y = new_x, new_y
+            animal.last_move_time = current_time
+            animal.move_cooldown = 2.0 + 3.0 * _rand()
         
-        distance = math.hypot(grid_x - territory_center_x, grid_y - territory_center_y)
-        return distance <= territory_radius
-
-    def _enforce_territory(self, animal):
-        """Ensure animal stays within its territory"""
-        current_x = getattr(animal, 'grid_x', 0)
-        current_y = getattr(animal, 'grid_y', 0)
+        # Territory behavior: one step along the sign of each offset back
+        # towards the center
+        if center_x is not None:
+            off_x = grid_x - center_x
+            off_y = grid_y - center_y
+            if off_x * off_x + off_y * off_y > radius_sq:
+                new_x = grid_x - (off_x > 0) + (off_x < 0)
+                new_y = grid_y - (off_y > 0) + (off_y < 0)
+                if valid(new_x, new_y):
+                    grid_x, grid_y = new_x, new_y
         
-        if not self._is_within_territory(animal, current_x, current_y):
-            # Move back towards territory center
-            territory_center_x = getattr(animal, 'territory_center_x', current_x)
-            territory_center_y = getattr(animal, 'territory_center_y', current_y)
-            
-            # Simple movement towards center
-            dx = 1 if territory_center_x > current_x else -1 if territory_center_x < current_x else 0
-            dy = 1 if territory_center_y > current_y else -1 if territory_center_y < current_y else 0
+        if grid_x != start_x or grid_y != start_y:
+            self._place_animal(animal, grid_x, grid_y)
+
+    def _update_all_vitals(self, dt):
+        """Update health and energy of all animals"""
+        drain = dt * 0.1
+        starve = dt * 0.5
+        regen = dt * 0.05
+        for animal in self.scene.animal_sprites:
+            if not animal.has_vitals:
+                continue
+            energy = animal.energy
             
-            new_x = current_x + dx
-            new_y = current_y + dy
+            # Energy decreases over time
+            energy = max(0, energy - drain)
             
-            if self._is_valid_spawn_location(new_x, new_y):
-                new_iso_x = (new_x - new_y) * (64 // 2)
-                new_iso_y = (new_x + new_y) * (37 // 2)
+            # Health decreases if energy is too low
+            if energy < 20:
+                health = animal.health = max(0, animal.health - starve)
                 
-                animal.center_x = new_iso_x
-                animal.center_y = new_iso_y
-                animal.grid_x = new_x
-                animal.grid_y = new_y
-
-    def _update_animal_vitals(self, animal, dt):
-        """Update animal health and energy"""
-        # Energy decreases over time
-        if hasattr(animal, 'energy'):
-            animal.energy = max(0, animal.energy - dt * 0.1)
+                # Animal dies if health reaches 0
+                if health <= 0:
+                    animal.alive = False
             
-            # Health decreases if energy is too low
-            if animal.energy < 20:
-                if hasattr(animal, 'health'):
-                    animal.health = max(0, animal.health - dt * 0.5)
-                    
-                    # Animal dies if health reaches 0
-                    if animal.health <= 0:
-                        animal.alive = False
-        
-        # Regenerate energy slowly
-        if hasattr(animal, 'energy') and animal.energy < 100:
-            animal.energy = min(100, animal.energy + dt * 0.05)
+            # Regenerate energy slowly
+            if energy < 100:
+                energy = min(100, energy + regen)
+            animal.energy = energy
 
     def get_animal_count(self):
         """Get total number of animals"""
@@ -253,30 +386,24 @@ class ArcadeAnimalManager:
 
     def get_species_count(self):
         """Get number of different species"""
-        species_ids = set()
-        for animal in self.scene.animal_sprites:
-            species_ids.add(getattr(animal, 'species_id', 0))
-        return len(species_ids)
+        self._sync_indexes()
+        return len(self._species_index)
 
     def get_animals_by_species(self):
         """Get animals grouped by species"""
-        species = {}
-        for animal in self.scene.animal_sprites:
-            species_id = getattr(animal, 'species_id', 0)
-            if species_id not in species:
-                species[species_id] = []
-            species[species_id].append(animal)
-        return species
+        self._sync_indexes()
+        return {species_id: list(members) for species_id, members in self._species_index.items()}
 
     def get_animals_in_area(self, center_x, center_y, radius):
         """Get all animals within a radius of a point"""
+        self._sync_indexes()
         animals_in_area = []
+        radius_sq = radius * radius
         
-        for animal in self.scene.animal_sprites:
-            animal_grid_x = getattr(animal, 'grid_x', 0)
-            animal_grid_y = getattr(animal, 'grid_y', 0)
-            distance = math.hypot(center_x - animal_grid_x, center_y - animal_grid_y)
-            if distance <= radius:
+        for animal in self.grid.query_radius(center_x, center_y, radius):
+            dx = center_x - animal.grid_x
+            dy = center_y - animal.grid_y
+            if dx * dx + dy * dy <= radius_sq:
                 animals_in_area.append(animal)
         
         return animals_in_area
@@ -285,19 +412,27 @@ class ArcadeAnimalManager:
         """Get the nearest animal to a grid position"""
         if not self.scene.animal_sprites:
             return None
+        self._sync_indexes()
         
-        nearest_animal = None
-        nearest_distance = float('inf')
-        
-        for animal in self.scene.animal_sprites:
-            animal_grid_x = getattr(animal, 'grid_x', 0)
-            animal_grid_y = getattr(animal, 'grid_y', 0)
-            distance = math.hypot(grid_x - animal_grid_x, grid_y - animal_grid_y)
-            if distance < nearest_distance:
-                nearest_animal = animal
-                nearest_distance = distance
-        
-        return nearest_animal
+        # Widen the search until the best hit lies inside the searched
+        # radius; once the radius covers the whole map every animal is seen
+        map_span = max(self.scene.terrain_width, self.scene.terrain_height)
+        radius = ANIMAL_GRID_CELL
+        while True:
+            nearest_animal = None
+            nearest_d2 = float('inf')
+            
+            for animal in self.grid.query_radius(grid_x, grid_y, radius):
+                dx = grid_x - animal.grid_x
+                dy = grid_y - animal.grid_y
+                d2 = dx * dx + dy * dy
+                if d2 < nearest_d2:
+                    nearest_animal = animal
+                    nearest_d2 = d2
+            
+            if nearest_d2 <= radius * radius or radius > 2 * map_span:
+                return nearest_animal
+            radius *= 2
 
     def calculate_screen_positions(self, camera_x, camera_y, zoom_scale):
         """Calculate screen positions for all animals (for compatibility)"""
@@ -313,46 +448,35 @@ class ArcadeAnimalManager:
 
     def get_animal_stats(self):
         """Get statistics about all animals"""
-        stats = {
-            "total_animals": len(self.scene.animal_sprites),
-            "species_count": self.get_species_count(),
-            "alive_animals": len([a for a in self.scene.animal_sprites if getattr(a, 'alive', True)]),
-            "diets": {},
-            "average_health": 0,
-            "average_energy": 0
-        }
+        self._sync_indexes()
+        animals = self.scene.animal_sprites
         
-        if self.scene.animal_sprites:
-            total_health = 0
-            total_energy = 0
-            
-            for animal in self.scene.animal_sprites:
-                # Count diets
-                diet = getattr(animal, 'diet', 'unknown')
-                stats["diets"][diet] = stats["diets"].get(diet, 0) + 1
-                
-                # Sum vitals
-                total_health += getattr(animal, 'health', 100)
-                total_energy += getattr(animal, 'energy', 100)
-            
-            stats["average_health"] = total_health / len(self.scene.animal_sprites)
-            stats["average_energy"] = total_energy / len(self.scene.animal_sprites)
+        # Species and diet tallies are kept incrementally; the rest are
+        # C-level reductions over the sprites
+        alive_count = sum(map(_get_alive, animals))
+        total_health = sum(map(_get_health, animals))
+        total_energy = sum(map(_get_energy, animals))
         
-        return stats
+        count = len(animals)
+        return {
+            "total_animals": count,
+            "species_count": len(self._species_index),
+            "alive_animals": alive_count,
+            "diets": dict(self._diet_counts),
+            "average_health": total_health / count if count else 0,
+            "average_energy": total_energy / count if count else 0
+        }
 
     def heal_all_animals(self, amount=10):
         """Heal all animals"""
         for animal in self.scene.animal_sprites:
-            if hasattr(animal, 'health'):
-                max_health = getattr(animal, 'max_health', 100)
-                animal.health = min(max_health, animal.health + amount)
+            animal.health = min(animal.max_health, animal.health + amount)
         print(f"[ArcadeAnimalManager] Healed all animals for {amount} HP")
 
     def feed_all_animals(self, amount=20):
         """Feed all animals (restore energy)"""
         for animal in self.scene.animal_sprites:
-            if hasattr(animal, 'energy'):
-                animal.energy = min(100, animal.energy + amount)
+            animal.energy = min(100, animal.energy + amount)
         print(f"[ArcadeAnimalManager] Fed all animals (+{amount} energy)")
 
     def create_predator(self, grid_x, grid_y):
@@ -371,7 +495,7 @@ class ArcadeAnimalManager:
             
             # Make it larger/different color
             animal.color = (200, 50, 50)  # Reddish
-            animal.texture = arcade.Texture.create_filled("predator", (30, 30), animal.color)
+            animal.texture = filled_texture("predator", (30, 30), animal.color)
             
             self.add_animal(animal)
             print(f"[ArcadeAnimalManager] Created predator at ({grid_x}, {grid_y})")
@@ -381,20 +505,21 @@ class ArcadeAnimalManager:
 
     def cleanup_dead_animals(self):
         """Remove dead animals from management"""
-        initial_count = len(self.scene.animal_sprites)
+        sprites = self.scene.animal_sprites
         
         # Remove dead animals
-        alive_animals = [animal for animal in self.scene.animal_sprites if getattr(animal, 'alive', True)]
-        
-        # Update sprite list
-        self.scene.animal_sprites.clear()
-        for animal in alive_animals:
-            self.scene.animal_sprites.append(animal)
+        alive_animals = [animal for animal in sprites if animal.alive]
+        removed_count = len(sprites) - len(alive_animals)
+        if removed_count == 0:
+            return 0
         
-        removed_count = initial_count - len(alive_animals)
-        if removed_count > 0:
-            print(f"[ArcadeAnimalManager] Removed {removed_count} dead animals")
+        # Update sprite list in one bulk refill
+        sprites.clear()
+        sprites.extend(alive_animals)
+        self.scene.animals_version += 1
+        self._rebuild_indexes(alive_animals)
         
+        print(f"[ArcadeAnimalManager] Removed {removed_count} dead animals")
         return removed_count
 
     def migrate_animals(self, from_area, to_area, count=None):
@@ -412,38 +537,19 @@ class ArcadeAnimalManager:
         if count is None:
             count = min(len(source_animals), random.randint(1, 3))
         
+        # Pick distinct migrants in one draw instead of choice + remove
         migrated = 0
-        for _ in range(count):
-            if not source_animals:
-                break
-            
-            animal = random.choice(source_animals)
-            source_animals.remove(animal)
-            
+        for animal in random.sample(source_animals, min(count, len(source_animals))):
             # Find new location in target area
-            attempts = 0
-            while attempts < 20:
-                angle = random.uniform(0, 2 * math.pi)
-                distance = random.uniform(0, to_radius)
-                new_x = int(to_center[0] + math.cos(angle) * distance)
-                new_y = int(to_center[1] + math.sin(angle) * distance)
-                
+            for new_x, new_y in self._sample_disc_tiles(20, to_center, to_radius):
                 if self._is_valid_spawn_location(new_x, new_y):
                     # Move animal
-                    new_iso_x = (new_x - new_y) * (64 // 2)
-                    new_iso_y = (new_x + new_y) * (37 // 2)
-                    
-                    animal.center_x = new_iso_x
-                    animal.center_y = new_iso_y
-                    animal.grid_x = new_x
-                    animal.grid_y = new_y
+                    self._place_animal(animal, new_x, new_y)
                     animal.territory_center_x = new_x
                     animal.territory_center_y = new_y
                     
                     migrated += 1
                     break
-                
-                attempts += 1
         
         print(f"[ArcadeAnimalManager] Migrated {migrated} animals")
         return migrated
@@ -451,16 +557,16 @@ class ArcadeAnimalManager:
     def get_animal_info(self, animal):
         """Get detailed information about an animal"""
         return {
-            "species_id": getattr(animal, 'species_id', 0),
+            "species_id": animal.species_id,
             "position": (animal.center_x, animal.center_y),
-            "grid_position": (getattr(animal, 'grid_x', 0), getattr(animal, 'grid_y', 0)),
-            "health": getattr(animal, 'health', 100),
-            "energy": getattr(animal, 'energy', 100),
-            "diet": getattr(animal, 'diet', 'unknown'),
-            "aggression": getattr(animal, 'aggression', 0.0),
-            "territory_center": (getattr(animal, 'territory_center_x', 0), 
-                               getattr(animal, 'territory_center_y', 0)),
-            "territory_radius": getattr(animal, 'territory_radius', 5),
-            "creation_time": getattr(animal, 'creation_time', 0),
-            "alive": getattr(animal, 'alive', True)
+            "grid_position": (animal.grid_x, animal.grid_y),
+            "health": animal.health,
+            "energy": animal.energy,
+            "diet": animal.diet,
+            "aggression": animal.aggression,
+            "territory_center": (animal.territory_center_x or 0, 
+                               animal.territory_center_y or 0),
+            "territory_radius": animal.territory_radius,
+            "creation_time": animal.creation_time,
+            "alive": animal.alive
         }
\ No newline at end of file
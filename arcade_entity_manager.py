@@ -6,8 +6,11 @@
 import random
 import time
 import math
+from itertools import compress
 import arcade
 
+from arcade_utilities import AUTO_SAVE_INTERVAL_NS
+
 # Constants
 TILE_WATER = 2
 TILE_WATERSTACK = 5
@@ -15,6 +18,39 @@ TILE_DESERT = 11
 TILE_WIDTH = 64
 TILE_HEIGHT = 37
 
+# Half tile extents for the grid -> isometric transform
+HALF_TILE_W = TILE_WIDTH // 2
+HALF_TILE_H = TILE_HEIGHT // 2
+
+BIPED_SPEED = 50  # pixels per second
+
+# Per-frame chance that an idle animal shuffles, and the log of its
+# complement for sampling the gap to the next animal that moves
+ANIMAL_WANDER_CHANCE = 0.005
+_LOG_STAY = math.log(1.0 - ANIMAL_WANDER_CHANCE)
+
+def _grid_to_iso(gx, gy):
+    """Isometric world position of the centre of tile (gx, gy)"""
+    return (gx - gy) * HALF_TILE_W, (gx + gy) * HALF_TILE_H
+
+# (ArcadeBipedSprite, ArcadeAnimalSprite), imported on first use because
+# arcade_planet_scene imports this module
+_SPRITE_CLASSES = None
+
+def _sprite_classes():
+    """The biped and animal sprite classes, resolved once"""
+    global _SPRITE_CLASSES
+    if _SPRITE_CLASSES is None:
+        from arcade_planet_scene import ArcadeBipedSprite, ArcadeAnimalSprite
+        _SPRITE_CLASSES = (ArcadeBipedSprite, ArcadeAnimalSprite)
+    return _SPRITE_CLASSES
+
+def _pop_random(items):
+    """Remove and return a random element of items in O(1); order is not kept"""
+    i = random.randrange(len(items))
+    items[i], items[-1] = items[-1], items[i]
+    return items.pop()
+
 def _rand_colour():
     """Bright random colour helper."""
     return random.randint(64, 255), random.randint(64, 255), random.randint(64, 255)
@@ -25,6 +61,23 @@ class ArcadeEntityManager:
     def __init__(self, scene):
         self.scene = scene
 
+        # get_units_by_mission result, valid until a mission changes or
+        # the biped list is replaced or resized
+        self._mission_counts = {}
+        self._mission_counts_key = None
+
+        # Cache for find_valid_land_tile, see _valid_tiles_from
+        self._valid_tiles = []
+        self._valid_tiles_src = None
+        self._valid_tiles_key = None
+
+        # Per-row land masks of map_data, see _land_mask
+        self._land_rows = []
+        self._land_rows_src = None
+
+        # Bipeds that moved this frame, drained by _flush_moved_bipeds
+        self._moved_bipeds = set()
+
     def spawn_initial_bipeds(self, valid_tiles):
         """Spawn initial bipeds"""
         print(f"[ArcadeEntityManager] Spawning initial bipeds")
@@ -36,22 +89,20 @@ class ArcadeEntityManager:
         # Spawn 2 initial bipeds
         colors = [(0, 255, 255), (102, 255, 102)]  # Cyan and green
         spawned_count = 0
+        debug = getattr(self.scene, 'debug_mode', False)
         
         for idx, color in enumerate(colors):
             if not valid_tiles:
                 break
                 
-            # Pick a random position
-            bx, by = random.choice(valid_tiles)
-            valid_tiles.remove((bx, by))  # Don't reuse the same spot
+            # Pick a random position; popping it means it won't be reused
+            bx, by = _pop_random(valid_tiles)
             
             # Calculate isometric position
-            iso_x = (bx - by) * (TILE_WIDTH // 2)
-            iso_y = (bx + by) * (TILE_HEIGHT // 2)
+            iso_x, iso_y = _grid_to_iso(bx, by)
             
             # Create biped sprite
-            from arcade_planet_scene import ArcadeBipedSprite
-            biped = ArcadeBipedSprite(iso_x, iso_y, f"Biped{idx}", color)
+            biped = _sprite_classes()[0](iso_x, iso_y, f"Biped{idx}", color)
             
             # Set biped properties
             biped.grid_x = bx
@@ -66,7 +117,8 @@ class ArcadeEntityManager:
             self.scene.biped_sprites.append(biped)
             spawned_count += 1
             
-            print(f"[ArcadeEntityManager] Biped {idx} spawned at ({bx}, {by})")
+            if debug:
+                print(f"[ArcadeEntityManager] Biped {idx} spawned at ({bx}, {by})")
         
         print(f"[ArcadeEntityManager] Successfully spawned {spawned_count} bipeds")
 
@@ -89,12 +141,10 @@ class ArcadeEntityManager:
             ax, ay = random.choice(valid_tiles)
             
             # Calculate isometric position
-            iso_x = (ax - ay) * (TILE_WIDTH // 2)
-            iso_y = (ax + ay) * (TILE_HEIGHT // 2)
+            iso_x, iso_y = _grid_to_iso(ax, ay)
             
             # Create animal sprite
-            from arcade_planet_scene import ArcadeAnimalSprite
-            animal = ArcadeAnimalSprite(iso_x, iso_y, _rand_colour())
+            animal = _sprite_classes()[1](iso_x, iso_y, _rand_colour())
             
             # Set animal properties
             animal.grid_x = ax
@@ -102,57 +152,83 @@ class ArcadeEntityManager:
             animal.species_id = i
             
             self.scene.animal_sprites.append(animal)
+        self.scene.animals_version += 1
         
         print(f"[ArcadeEntityManager] Spawned {len(self.scene.animal_sprites)} animals")
 
     def update_all_entities(self, dt):
         """Update all entities in the scene"""
-        # Update all sprite lists
-        for sprite_list in self.scene.sprite_lists:
-            sprite_list.update()
-        
-        # Update any custom entity logic here
-        self._update_biped_movement(dt)
-        self._update_animal_behavior(dt)
+        # One error boundary for the whole frame; the callbacks below let
+        # their errors propagate to here
+        try:
+            # Update the sprite lists that have per-frame logic. Bipeds are
+            # updated inside the movement pass so they are walked only once.
+            bipeds = self.scene.biped_sprites
+            for sprite_list in self.scene.active_sprite_lists:
+                if sprite_list is not bipeds:
+                    sprite_list.update()
+            
+            # Update any custom entity logic here. Animal behaviour only
+            # visits the few animals that move, so it stays a separate step.
+            self._update_biped_movement(dt)
+            self._update_animal_behavior(dt)
+            self._flush_moved_bipeds()
+        except Exception as e:
+            print(f"[ArcadeEntityManager] Error updating entities: {e}")
 
     def _update_biped_movement(self, dt):
-        """Update biped movement"""
+        """Run each biped's own update, then move the ones with a target"""
+        # Read and write each sprite's position once as a pair; every
+        # center_x/center_y assignment runs arcade's sprite update hooks
+        speed = BIPED_SPEED * dt
+        moved = self._moved_bipeds
+        hypot = math.hypot
         for biped in self.scene.biped_sprites:
-            if hasattr(biped, 'moving') and biped.moving:
-                # Simple movement logic - can be expanded
-                if hasattr(biped, 'target_x') and hasattr(biped, 'target_y'):
-                    # Move towards target
-                    dx = biped.target_x - biped.center_x
-                    dy = biped.target_y - biped.center_y
-                    distance = math.hypot(dx, dy)
-                    
-                    if distance > 2:  # Still moving
-                        speed = 50 * dt  # pixels per second
-                        biped.center_x += (dx / distance) * speed
-                        biped.center_y += (dy / distance) * speed
-                    else:
-                        # Reached target
-                        biped.center_x = biped.target_x
-                        biped.center_y = biped.target_y
-                        biped.moving = False
-                        delattr(biped, 'target_x')
-                        delattr(biped, 'target_y')
+            biped.update(dt)
+            if not biped.moving:
+                continue
+            moved.add(biped)
+            # Simple movement logic - can be expanded
+            target_x = biped.target_x
+            target_y = biped.target_y
+            x, y = biped.position
+            
+            # Move towards target
+            dx = target_x - x
+            dy = target_y - y
+            distance = hypot(dx, dy)
+            
+            if distance > 2:  # Still moving
+                step = speed / distance
+                biped.position = (x + dx * step, y + dy * step)
+            else:
+                # Reached target
+                biped.position = (target_x, target_y)
+                biped.moving = False
 
     def _update_animal_behavior(self, dt):
         """Update animal behavior"""
-        for animal in self.scene.animal_sprites:
-            # Simple random movement
-            if random.random() < 0.005:  # 0.5% chance per frame
-                animal.center_x += random.randint(-20, 20)
-                animal.center_y += random.randint(-20, 20)
+        # Simple random movement: each animal has an independent small
+        # chance per frame, so jump straight to the next one that moves by
+        # sampling the geometric gap instead of rolling for every animal
+        animals = self.scene.animal_sprites
+        count = len(animals)
+        rand = random.random
+        randint = random.randint
+        i = int(math.log(1.0 - rand()) / _LOG_STAY)
+        while i < count:
+            animal = animals[i]
+            animal.center_x += randint(-20, 20)
+            animal.center_y += randint(-20, 20)
+            i += 1 + int(math.log(1.0 - rand()) / _LOG_STAY)
 
     def send_biped_to_collect(self, drop_obj):
         """Send a biped to collect a resource drop"""
         if not self.scene.biped_sprites:
             return
             
-        # Get first biped
-        biped = self.scene.biped_sprites[0]
+        # Send whichever biped is closest to the drop
+        biped = self.nearest_biped(drop_obj.center_x, drop_obj.center_y)
         
         # Set movement target
         biped.target_x = drop_obj.center_x
@@ -160,7 +236,16 @@ class ArcadeEntityManager:
         biped.moving = True
         biped.mission = "COLLECT_DROP"
         
-        print(f"[ArcadeEntityManager] Sent biped to collect drop at ({drop_obj.center_x}, {drop_obj.center_y})")
+        if getattr(self.scene, 'debug_mode', False):
+            print(f"[ArcadeEntityManager] Sent biped to collect drop at ({drop_obj.center_x}, {drop_obj.center_y})")
+
+    def nearest_biped(self, x, y):
+        """Biped whose sprite centre is closest to (x, y), or None"""
+        def dist_sq(biped):
+            dx = biped.center_x - x
+            dy = biped.center_y - y
+            return dx * dx + dy * dy
+        return min(self.scene.biped_sprites, key=dist_sq, default=None)
 
     def pick_up_drop(self, drop_obj):
         """Pick up a resource drop"""
@@ -172,29 +257,76 @@ class ArcadeEntityManager:
         
         # Remove drop
         drop_obj.alive = False
-        if drop_obj in self.scene.drop_sprites:
+        try:
+            # remove() does its own search; no separate membership scan
             self.scene.drop_sprites.remove(drop_obj)
+        except ValueError:
+            pass
         
-        print(f"Picked up {quantity} × {resource_type}: {self.scene.inventory}")
+        if getattr(self.scene, 'debug_mode', False):
+            print(f"Picked up {quantity} × {resource_type}: {self.scene.inventory}")
 
     def find_valid_land_tile(self, tile_list, max_attempts=500):
         """Find a valid land tile from the list"""
         if not tile_list:
             return None
-            
-        attempts = 0
-        while attempts < max_attempts:
-            gx, gy = random.choice(tile_list)
-            
-            # Check if valid
-            if (0 <= gx < self.scene.terrain_width and 
-                0 <= gy < self.scene.terrain_height and
-                (gx, gy) not in self.scene.blocked_tiles):
-                return gx, gy
-                
-            attempts += 1
         
-        return None
+        # Sample straight from the tiles that pass the checks instead of
+        # retrying random picks; max_attempts is kept for compatibility
+        valid = self._valid_tiles_from(tile_list)
+        if not valid:
+            return None
+        return valid[random.randrange(len(valid))]
+
+    def _valid_tiles_from(self, tile_list):
+        """
+        The in-bounds, unblocked tiles of tile_list. Cached until another
+        list is passed or this one is resized, the scene's blocked_version
+        moves on, or the terrain size changes.
+        """
+        blocked = self.scene.blocked_tiles
+        key = (len(tile_list), getattr(self.scene, 'blocked_version', 0),
+               self.scene.terrain_width, self.scene.terrain_height)
+        if tile_list is not self._valid_tiles_src or key != self._valid_tiles_key:
+            width = self.scene.terrain_width
+            height = self.scene.terrain_height
+            self._valid_tiles = [
+                (gx, gy) for gx, gy in tile_list
+                if 0 <= gx < width and 0 <= gy < height and (gx, gy) not in blocked
+            ]
+            self._valid_tiles_src = tile_list
+            self._valid_tiles_key = key
+        return self._valid_tiles
+
+    def _land_mask(self):
+        """
+        One bytes row per map_data row, 1 where the tile is land (not water
+        or void). Rebuilt only when map_data is replaced.
+        """
+        map_data = self.scene.map_data
+        if self._land_rows_src is not map_data:
+            self._land_rows = [
+                bytes(tile not in (TILE_WATER, TILE_WATERSTACK, -1) for tile in row)
+                for row in map_data
+            ]
+            self._land_rows_src = map_data
+        return self._land_rows
+
+    def _open_land_tiles(self, x0, x1, y0, y1):
+        """Unblocked, non-water tiles in the inclusive box [x0, x1] x [y0, y1]"""
+        land = self._land_mask()
+        blocked = self.scene.blocked_tiles
+        if not land:
+            return []
+        x0 = max(0, x0)
+        x1 = min(x1, len(land[0]) - 1)
+        y1 = min(y1, len(land) - 1)
+        return [
+            (x, y)
+            for y in range(max(0, y0), y1 + 1)
+            for x in compress(range(x0, x1 + 1), land[y][x0:x1 + 1])
+            if (x, y) not in blocked
+        ]
 
     def check_entity_emergency_spawning(self):
         """Check if emergency spawning is needed"""
@@ -210,137 +342,141 @@ class ArcadeEntityManager:
 
     def _generate_emergency_bipeds(self):
         """Generate emergency bipeds"""
-        for i in range(2):
-            # Find a safe spot
-            attempts = 0
-            while attempts < 20:
-                x = random.randint(self.scene.terrain_width//4, 3*self.scene.terrain_width//4)
-                y = random.randint(self.scene.terrain_height//4, 3*self.scene.terrain_height//4)
-                
-                if ((x, y) not in self.scene.blocked_tiles and 
-                    0 <= y < len(self.scene.map_data) and 
-                    0 <= x < len(self.scene.map_data[0]) and
-                    self.scene.map_data[y][x] not in (TILE_WATER, TILE_WATERSTACK, -1)):
-                    
-                    # Calculate isometric position
-                    iso_x = (x - y) * (TILE_WIDTH // 2)
-                    iso_y = (x + y) * (TILE_HEIGHT // 2)
-                    
-                    color = (0, 255, 255) if i == 0 else (102, 255, 102)
-                    from arcade_planet_scene import ArcadeBipedSprite
-                    biped = ArcadeBipedSprite(iso_x, iso_y, f"Emergency{i}", color)
-                    biped.grid_x = x
-                    biped.grid_y = y
-                    biped.unit_id = f"emergency_biped_{i}"
-                    
-                    self.scene.biped_sprites.append(biped)
-                    print(f"[ArcadeEntityManager] Emergency biped {i} at ({x}, {y})")
-                    break
-                attempts += 1
+        # Safe spots in the middle half of the map, sampled directly
+        width, height = self.scene.terrain_width, self.scene.terrain_height
+        spots = self._open_land_tiles(width // 4, 3 * width // 4, height // 4, 3 * height // 4)
+        debug = getattr(self.scene, 'debug_mode', False)
+        for i, (x, y) in enumerate(random.sample(spots, min(2, len(spots)))):
+            # Calculate isometric position
+            iso_x, iso_y = _grid_to_iso(x, y)
+            
+            color = (0, 255, 255) if i == 0 else (102, 255, 102)
+            biped = _sprite_classes()[0](iso_x, iso_y, f"Emergency{i}", color)
+            biped.grid_x = x
+            biped.grid_y = y
+            biped.unit_id = f"emergency_biped_{i}"
+            
+            self.scene.biped_sprites.append(biped)
+            if debug:
+                print(f"[ArcadeEntityManager] Emergency biped {i} at ({x}, {y})")
 
     def _generate_emergency_animals(self):
         """Generate emergency animals"""
-        for i in range(3):
-            # Find a safe spot
-            attempts = 0
-            while attempts < 15:
-                x = random.randint(1, self.scene.terrain_width - 2)
-                y = random.randint(1, self.scene.terrain_height - 2)
-                
-                if ((x, y) not in self.scene.blocked_tiles and 
-                    0 <= y < len(self.scene.map_data) and 
-                    0 <= x < len(self.scene.map_data[0]) and
-                    self.scene.map_data[y][x] not in (TILE_WATER, TILE_WATERSTACK, -1)):
-                    
-                    # Calculate isometric position
-                    iso_x = (x - y) * (TILE_WIDTH // 2)
-                    iso_y = (x + y) * (TILE_HEIGHT // 2)
-                    
-                    from arcade_planet_scene import ArcadeAnimalSprite
-                    animal = ArcadeAnimalSprite(iso_x, iso_y, _rand_colour())
-                    animal.grid_x = x
-                    animal.grid_y = y
-                    animal.species_id = i
-                    
-                    self.scene.animal_sprites.append(animal)
-                    print(f"[ArcadeEntityManager] Emergency animal {i} at ({x}, {y})")
-                    break
-                attempts += 1
+        # Safe spots away from the map edge, sampled directly
+        width, height = self.scene.terrain_width, self.scene.terrain_height
+        spots = self._open_land_tiles(1, width - 2, 1, height - 2)
+        debug = getattr(self.scene, 'debug_mode', False)
+        for i, (x, y) in enumerate(random.sample(spots, min(3, len(spots)))):
+            # Calculate isometric position
+            iso_x, iso_y = _grid_to_iso(x, y)
+            
+            animal = _sprite_classes()[1](iso_x, iso_y, _rand_colour())
+            animal.grid_x = x
+            animal.grid_y = y
+            animal.species_id = i
+            
+            self.scene.animal_sprites.append(animal)
+            if debug:
+                print(f"[ArcadeEntityManager] Emergency animal {i} at ({x}, {y})")
+        self.scene.animals_version += 1
 
     def auto_save_trigger(self, reason="unknown"):
         """Trigger auto-save when important state changes occur"""
-        try:
-            if hasattr(self.scene, '_last_auto_save'):
-                time_since_save = time.time() - self.scene._last_auto_save
-                if time_since_save < 5.0:  # Don't save more than once every 5 seconds
-                    return
-            
-            self.scene._last_auto_save = time.time()
+        # Don't save more than once every 5 seconds
+        now = time.monotonic_ns()
+        if now - self.scene._last_auto_save_ns < AUTO_SAVE_INTERVAL_NS:
+            return
+        self.scene._last_auto_save_ns = now
+        if getattr(self.scene, 'debug_mode', False):
             print(f"[ArcadeEntityManager] Auto-save triggered: {reason}")
-            # TODO: Implement actual saving
-        except Exception as e:
-            print(f"[ArcadeEntityManager] Auto-save failed ({reason}): {e}")
+        # TODO: Implement actual saving
 
     def on_biped_moved(self, biped):
-        """Called whenever a biped moves to a new position"""
-        try:
-            biped.last_command_time = time.time()
-            self.auto_save_trigger("biped_moved")
-        except Exception as e:
-            print(f"[ArcadeEntityManager] Error tracking biped movement: {e}")
+        """
+        Called whenever a biped moves to a new position. The bookkeeping is
+        deferred to _flush_moved_bipeds at the end of the frame.
+        """
+        self._moved_bipeds.add(biped)
+
+    def _flush_moved_bipeds(self):
+        """Stamp every biped that moved this frame and probe auto-save once"""
+        moved = self._moved_bipeds
+        if not moved:
+            return
+        now = time.time()
+        for biped in moved:
+            biped.last_command_time = now
+        moved.clear()
+        self.auto_save_trigger("biped_moved")
 
     def on_biped_command(self, biped, command_type):
         """Called whenever a biped receives a new command"""
-        try:
-            biped.last_command_time = time.time()
-            if not hasattr(biped, 'mission_data'):
-                biped.mission_data = {}
-            biped.mission_data['last_command'] = command_type
-            self.auto_save_trigger(f"biped_command_{command_type}")
-        except Exception as e:
-            print(f"[ArcadeEntityManager] Error tracking biped command: {e}")
+        if biped is None:
+            return
+        biped.last_command_time = time.time()
+        if not hasattr(biped, 'mission_data'):
+            biped.mission_data = {}
+        biped.mission_data['last_command'] = command_type
+        self.auto_save_trigger(f"biped_command_{command_type}")
 
     def get_units_by_mission(self):
         """Get count of units by mission type for monitoring"""
-        try:
+        bipeds = self.scene.biped_sprites
+        key = (_sprite_classes()[0].mission_epoch, id(bipeds), len(bipeds))
+        if key != self._mission_counts_key:
             mission_counts = {}
-            for biped in self.scene.biped_sprites:
+            for biped in bipeds:
                 mission = str(getattr(biped, 'mission', 'IDLE'))
                 mission_counts[mission] = mission_counts.get(mission, 0) + 1
-            return mission_counts
-        except Exception as e:
-            print(f"[ArcadeEntityManager] Error counting units by mission: {e}")
-            return {"ERROR": 1}
+            self._mission_counts = mission_counts
+            self._mission_counts_key = key
+        return dict(self._mission_counts)
 
     def simulate_movement_progress(self, biped, time_away_seconds):
         """Simulate how much progress a biped made while the player was away"""
-        try:
-            # Simple simulation - just complete the movement if enough time passed
-            if hasattr(biped, 'moving') and biped.moving:
-                if hasattr(biped, 'target_x') and hasattr(biped, 'target_y'):
-                    # Calculate if biped would have reached target
-                    dx = biped.target_x - biped.center_x
-                    dy = biped.target_y - biped.center_y
-                    distance = math.hypot(dx, dy)
-                    
-                    # Assume movement speed of 50 pixels per second
-                    time_needed = distance / 50
-                    
-                    if time_away_seconds >= time_needed:
-                        # Complete the movement
-                        biped.center_x = biped.target_x
-                        biped.center_y = biped.target_y
-                        biped.moving = False
-                        return f"Completed movement after {time_needed:.1f}s"
-                    else:
-                        # Partial movement
-                        progress = time_away_seconds / time_needed
-                        biped.center_x += dx * progress
-                        biped.center_y += dy * progress
-                        return f"Moved {progress*100:.1f}% of the way"
-            
+        if biped is None:
             return "No movement to simulate"
-            
-        except Exception as e:
-            print(f"[ArcadeEntityManager] Error simulating movement: {e}")
-            return f"Simulation error: {e}"
\ No newline at end of file
+        return self._catch_up_movement(biped, time_away_seconds)
+
+    def simulate_movement_progress_bulk(self, bipeds_with_time):
+        """
+        simulate_movement_progress for a batch of (biped, time_away_seconds)
+        pairs in one pass; returns the result messages in the same order
+        """
+        catch_up = self._catch_up_movement
+        results = []
+        for biped, time_away_seconds in bipeds_with_time:
+            try:
+                results.append(catch_up(biped, time_away_seconds))
+            except Exception as e:
+                print(f"[ArcadeEntityManager] Error simulating movement: {e}")
+                results.append(f"Simulation error: {e}")
+        return results
+
+    @staticmethod
+    def _catch_up_movement(biped, time_away_seconds):
+        """Advance one biped along its straight-line move by time_away_seconds"""
+        # Simple simulation - just complete the movement if enough time passed
+        if not biped.moving:
+            return "No movement to simulate"
+        target_x = biped.target_x
+        target_y = biped.target_y
+        x, y = biped.position
+        
+        # Calculate if biped would have reached target
+        dx = target_x - x
+        dy = target_y - y
+        
+        # Assume movement speed of BIPED_SPEED pixels per second
+        time_needed = math.hypot(dx, dy) / BIPED_SPEED
+        
+        if time_away_seconds >= time_needed:
+            # Complete the movement
+            biped.position = (target_x, target_y)
+            biped.moving = False
+            return f"Completed movement after {time_needed:.1f}s"
+        
+        # Partial movement
+        progress = time_away_seconds / time_needed
+        biped.position = (x + dx * progress, y + dy * progress)
+        return f"Moved {progress*100:.1f}% of the way"
@@ -4,18 +4,44 @@
 ##########################################################
 
 import arcade
-import math
 import time
 
 TILE_WIDTH = 64
 TILE_HEIGHT = 37
 
+# Half tile extents for the grid <-> isometric transforms, and their
+# reciprocals so screen -> grid multiplies instead of dividing
+HALF_TILE_W = TILE_WIDTH // 2
+HALF_TILE_H = TILE_HEIGHT // 2
+INV_HALF_TILE_W = 1.0 / HALF_TILE_W
+INV_HALF_TILE_H = 1.0 / HALF_TILE_H
+
+# Screen-space radius for hovering and clicking resource drops, squared
+# so hit tests can skip the square root
+DROP_PICK_RADIUS = 20
+DROP_PICK_RADIUS_SQ = DROP_PICK_RADIUS * DROP_PICK_RADIUS
+
+# World-space bucket size for drop hit tests; at least DROP_PICK_RADIUS so
+# the 3x3 cells around the cursor hold every drop in reach
+DROP_CELL = 32
+
 class ArcadeEventHandler:
     """Handles all input processing and event management for Arcade"""
     
     def __init__(self, scene):
         self.scene = scene
 
+        # Attach to the scene, whose on_update then calls ours once per frame
+        scene.event_handler = self
+
+        # Drops bucketed by DROP_CELL world cell, see _drops_near
+        self._drop_cells = {}
+        self._drop_cells_key = None
+        self._hovered_drops = []
+
+        # Latest cursor position awaiting a hover pass, or None
+        self._pending_mouse = None
+
     def on_mouse_press(self, x: int, y: int, button: int, modifiers: int):
         """Handle mouse button down events"""
         if button == arcade.MOUSE_BUTTON_LEFT:
@@ -58,13 +84,9 @@ class ArcadeEventHandler:
 
     def on_mouse_motion(self, x: int, y: int, dx: int, dy: int):
         """Handle mouse motion events"""
-        # Update drop hover states
-        for drop in self.scene.drops:
-            # Convert drop position to screen coordinates for collision detection
-            drop_screen_x, drop_screen_y = self._world_to_screen(drop.center_x, drop.center_y)
-            distance = math.hypot(x - drop_screen_x, y - drop_screen_y)
-            if hasattr(drop, 'hovered'):
-                drop.hovered = distance < 20  # 20 pixel radius for hover
+        # Hover is refreshed once per frame in on_update; motion events can
+        # arrive far faster than that, so only the latest position is kept
+        self._pending_mouse = (x, y)
         
         # Handle camera dragging
         if self.scene.mouse_dragging:
@@ -72,6 +94,30 @@ class ArcadeEventHandler:
             self.scene.last_mouse_x = x
             self.scene.last_mouse_y = y
 
+    def on_update(self, delta_time: float):
+        """Per-frame input work, called once per frame from the scene's on_update"""
+        if self._pending_mouse is not None:
+            self._update_drop_hover(*self._pending_mouse)
+            self._pending_mouse = None
+
+    def _update_drop_hover(self, x: int, y: int):
+        """Set hovered on the drops within DROP_PICK_RADIUS of screen point (x, y)"""
+        # Drop screen position is world minus camera, so shift the cursor
+        # into world space once instead
+        camera_x, camera_y = self._camera_position()
+        mx = x + camera_x
+        my = y + camera_y
+        for drop in self._hovered_drops:
+            drop.hovered = False
+        hovered = []
+        for drop in self._drops_near(mx, my):
+            ddx = mx - drop.center_x
+            ddy = my - drop.center_y
+            if ddx * ddx + ddy * ddy < DROP_PICK_RADIUS_SQ:
+                drop.hovered = True
+                hovered.append(drop)
+        self._hovered_drops = hovered
+
     def on_key_press(self, key: int, modifiers: int):
         """Handle keyboard input"""
         if key == arcade.key.ESCAPE:
@@ -115,16 +161,23 @@ class ArcadeEventHandler:
 
     def _handle_mining_click(self, x: int, y: int):
         """Handle mining/digging when in mining mode"""
-        print(f"[ArcadeEventHandler] Mining mode click at ({x}, {y})")
+        debug = getattr(self.scene, 'debug_mode', False)
+        if debug:
+            print(f"[ArcadeEventHandler] Mining mode click at ({x}, {y})")
         
         # Convert screen to grid coordinates
         grid_x, grid_y = self._screen_to_grid(x, y)
         
         # Clamp to map bounds
-        grid_x = max(0, min(grid_x, self.scene.terrain_width - 1))
-        grid_y = max(0, min(grid_y, self.scene.terrain_height - 1))
+        max_x = self.scene.terrain_width - 1
+        max_y = self.scene.terrain_height - 1
+        grid_x = max_x if grid_x > max_x else grid_x
+        grid_x = 0 if grid_x < 0 else grid_x
+        grid_y = max_y if grid_y > max_y else grid_y
+        grid_y = 0 if grid_y < 0 else grid_y
         
-        print(f"[ArcadeEventHandler] Mining at grid ({grid_x}, {grid_y})")
+        if debug:
+            print(f"[ArcadeEventHandler] Mining at grid ({grid_x}, {grid_y})")
         
         # For now, just print the action - can be enhanced with actual mining logic
         if hasattr(self.scene, 'resource_system'):
@@ -135,17 +188,44 @@ class ArcadeEventHandler:
 
     def _check_drop_collection(self, x: int, y: int):
         """Check if clicked on a resource drop and send biped to collect"""
-        for drop in self.scene.drops:
-            drop_screen_x, drop_screen_y = self._world_to_screen(drop.center_x, drop.center_y)
-            distance = math.hypot(x - drop_screen_x, y - drop_screen_y)
-            if distance < 20:  # 20 pixel radius for click detection
-                if hasattr(self.scene, 'entity_manager'):
-                    self.scene.entity_manager.send_biped_to_collect(drop)
+        camera_x, camera_y = self._camera_position()
+        mx = x + camera_x
+        my = y + camera_y
+        for drop in self._drops_near(mx, my):
+            ddx = mx - drop.center_x
+            ddy = my - drop.center_y
+            if ddx * ddx + ddy * ddy < DROP_PICK_RADIUS_SQ:
+                entity_manager = getattr(self.scene, 'entity_manager', None)
+                if entity_manager is not None:
+                    entity_manager.send_biped_to_collect(drop)
                 else:
                     # Fallback
                     self.scene.send_biped_to_collect(drop)
                 break
 
+    def _drops_near(self, world_x, world_y):
+        """
+        Drops in the 3x3 DROP_CELL cells around a world point. Drops don't
+        move, so the buckets are rebuilt only when the scene's drops_version
+        moves on.
+        """
+        drops = self.scene.drops
+        key = getattr(self.scene, 'drops_version', 0)
+        if key != self._drop_cells_key:
+            cells = {}
+            for drop in drops:
+                cell = (int(drop.center_x // DROP_CELL), int(drop.center_y // DROP_CELL))
+                cells.setdefault(cell, []).append(drop)
+            self._drop_cells = cells
+            self._drop_cells_key = key
+
+        cx = int(world_x // DROP_CELL)
+        cy = int(world_y // DROP_CELL)
+        get = self._drop_cells.get
+        for ky in (cy - 1, cy, cy + 1):
+            for kx in (cx - 1, cx, cx + 1):
+                yield from get((kx, ky), ())
+
     def _attempt_build_first_house(self):
         """Attempt to build the first house"""
         if getattr(self.scene, 'house_built', False) or not self.scene.biped_sprites:
@@ -168,6 +248,7 @@ class ArcadeEventHandler:
         
         self.scene.house_sprites.append(house_sprite)
         self.scene.blocked_tiles.add((gx, gy))
+        self.scene.blocked_version += 1
         self.scene.house_built = True
         print(f"[ArcadeEventHandler] House built at grid ({gx}, {gy})")
 
@@ -180,6 +261,7 @@ class ArcadeEventHandler:
             import random
             return random.randint(64, 255), random.randint(64, 255), random.randint(64, 255)
         
+        debug = getattr(self.scene, 'debug_mode', False)
         for idx in range(2):
             # Find valid tile near house
             tile = self._find_nearby_valid_tile(house_x, house_y)
@@ -189,8 +271,8 @@ class ArcadeEventHandler:
             bx, by = tile
             
             # Calculate isometric position
-            iso_x = (bx - by) * (TILE_WIDTH // 2)
-            iso_y = (bx + by) * (TILE_HEIGHT // 2)
+            iso_x = (bx - by) * HALF_TILE_W
+            iso_y = (bx + by) * HALF_TILE_H
             
             # Create biped sprite
             from arcade_planet_scene import ArcadeBipedSprite
@@ -205,19 +287,25 @@ class ArcadeEventHandler:
             # Add to scene
             self.scene.biped_sprites.append(biped_sprite)
             
-            print(f"[ArcadeEventHandler] Spawned house biped {idx} at ({bx}, {by})")
+            if debug:
+                print(f"[ArcadeEventHandler] Spawned house biped {idx} at ({bx}, {by})")
 
     def _find_nearby_valid_tile(self, center_x, center_y, radius=4):
         """Find a valid tile near the center point"""
+        width = self.scene.terrain_width
+        height = self.scene.terrain_height
+        blocked = self.scene.blocked_tiles
         for r in range(1, radius + 1):
+            # Walk only the ring at distance r, in the same column-major
+            # order as scanning the full square and keeping its perimeter
             for dx in range(-r, r + 1):
-                for dy in range(-r, r + 1):
-                    if abs(dx) == r or abs(dy) == r:  # Only check perimeter
-                        test_x, test_y = center_x + dx, center_y + dy
-                        if (0 <= test_x < self.scene.terrain_width and 
-                            0 <= test_y < self.scene.terrain_height and
-                            (test_x, test_y) not in self.scene.blocked_tiles):
-                            return test_x, test_y
+                edge = dx == -r or dx == r
+                for dy in (range(-r, r + 1) if edge else (-r, r)):
+                    test_x, test_y = center_x + dx, center_y + dy
+                    if (0 <= test_x < width and 
+                        0 <= test_y < height and
+                        (test_x, test_y) not in blocked):
+                        return test_x, test_y
         return None
 
     def _toggle_simulation_mode(self):
@@ -267,25 +355,37 @@ class ArcadeEventHandler:
         self.scene._center_camera()
         print("[ArcadeEventHandler] Camera centered")
 
-    def _screen_to_grid(self, screen_x, screen_y):
-        """Convert screen coordinates to grid coordinates"""
-        # Get camera position
-        camera_x, camera_y = self.scene.camera.position if self.scene.camera else (0, 0)
+    def _camera_position(self):
+        """Camera position as (x, y); read once per event and reuse it"""
+        camera = self.scene.camera
+        return camera.position if camera else (0, 0)
+
+    def _screen_to_grid(self, screen_x, screen_y, camera_pos=None):
+        """
+        Convert screen coordinates to grid coordinates. camera_pos is an
+        (x, y) snapshot from _camera_position, taken here if not given.
+        """
+        if camera_pos is None:
+            camera_pos = self._camera_position()
+        camera_x, camera_y = camera_pos
         
         # Convert to world coordinates
         world_x = screen_x + camera_x
         world_y = screen_y + camera_y
         
         # Convert to grid coordinates (isometric conversion)
-        tile_x = int((world_x / (TILE_WIDTH // 2) + world_y / (TILE_HEIGHT // 2)) / 2)
-        tile_y = int((world_y / (TILE_HEIGHT // 2) - world_x / (TILE_WIDTH // 2)) / 2)
+        u = world_x * INV_HALF_TILE_W
+        v = world_y * INV_HALF_TILE_H
+        tile_x = int((v + u) * 0.5)
+        tile_y = int((v - u) * 0.5)
         
         return tile_x, tile_y
 
-    def _world_to_screen(self, world_x, world_y):
-        """Convert world coordinates to screen coordinates"""
-        # Get camera position
-        camera_x, camera_y = self.scene.camera.position if self.scene.camera else (0, 0)
+    def _world_to_screen(self, world_x, world_y, camera_pos=None):
+        """Convert world coordinates to screen coordinates, see _screen_to_grid"""
+        if camera_pos is None:
+            camera_pos = self._camera_position()
+        camera_x, camera_y = camera_pos
         
         # Convert to screen coordinates
         screen_x = world_x - camera_x
@@ -316,26 +416,28 @@ class ArcadeEventHandler:
         top = min(start_y, end_y)
         bottom = max(start_y, end_y)
         
+        # Shift the rectangle into world space once, so each unit is tested
+        # against its world position with no per-unit conversion
+        camera_x, camera_y = self._camera_position()
+        left += camera_x
+        right += camera_x
+        top += camera_y
+        bottom += camera_y
+        
         # Select units within rectangle
         selected_units = []
         for biped_sprite in self.scene.biped_sprites:
-            # Convert world position to screen position
-            screen_x, screen_y = self._world_to_screen(biped_sprite.center_x, biped_sprite.center_y)
-            
-            if (left <= screen_x <= right and 
-                top <= screen_y <= bottom):
-                if hasattr(biped_sprite, 'selected'):
-                    biped_sprite.selected = True
+            world_x, world_y = biped_sprite.position
+            hit = left <= world_x <= right and top <= world_y <= bottom
+            biped_sprite.selected = hit
+            if hit:
                 selected_units.append(biped_sprite)
-            else:
-                if hasattr(biped_sprite, 'selected'):
-                    biped_sprite.selected = False
                 
         return selected_units
 
     def handle_group_movement_command(self, target_x, target_y):
         """Handle movement command for multiple selected units"""
-        selected_units = [u for u in self.scene.biped_sprites if getattr(u, 'selected', False)]
+        selected_units = [u for u in self.scene.biped_sprites if u.selected]
         
         if not selected_units:
             return False
@@ -344,6 +446,8 @@ class ArcadeEventHandler:
         grid_x, grid_y = self._screen_to_grid(target_x, target_y)
         
         # Move each selected unit to the target area with some spacing
+        max_x = self.scene.terrain_width - 1
+        max_y = self.scene.terrain_height - 1
         for i, unit in enumerate(selected_units):
             # Calculate offset position for formation
             offset_x = (i % 3) - 1  # -1, 0, 1 pattern
@@ -352,22 +456,25 @@ class ArcadeEventHandler:
             final_x = grid_x + offset_x
             final_y = grid_y + offset_y
             
-            # Clamp to map bounds
-            final_x = max(0, min(final_x, self.scene.terrain_width - 1))
-            final_y = max(0, min(final_y, self.scene.terrain_height - 1))
+            # Clamp to map bounds; comparisons rather than min/max calls,
+            # upper bound first so an empty map still clamps to 0
+            final_x = max_x if final_x > max_x else final_x
+            final_x = 0 if final_x < 0 else final_x
+            final_y = max_y if final_y > max_y else final_y
+            final_y = 0 if final_y < 0 else final_y
             
             # Convert back to isometric coordinates
-            target_iso_x = (final_x - final_y) * (TILE_WIDTH // 2)
-            target_iso_y = (final_x + final_y) * (TILE_HEIGHT // 2)
+            target_iso_x = (final_x - final_y) * HALF_TILE_W
+            target_iso_y = (final_x + final_y) * HALF_TILE_H
             
             # Set movement target
             unit.target_x = target_iso_x
             unit.target_y = target_iso_y
             unit.moving = True
-            if hasattr(unit, 'mission'):
-                unit.mission = "MOVE_TO"
+            unit.mission = "MOVE_TO"
                 
-        print(f"[ArcadeEventHandler] Group moving {len(selected_units)} units to ({grid_x}, {grid_y})")
+        if getattr(self.scene, 'debug_mode', False):
+            print(f"[ArcadeEventHandler] Group moving {len(selected_units)} units to ({grid_x}, {grid_y})")
         return True
 
     def get_input_state(self):
@@ -375,7 +482,7 @@ class ArcadeEventHandler:
         return {
             "dragging": getattr(self.scene, 'mouse_dragging', False),
             "mining_mode": getattr(self.scene, 'mining_mode', False),
-            "camera_position": self.scene.camera.position if self.scene.camera else (0, 0),
+            "camera_position": self._camera_position(),
             "zoom_scale": self.scene.zoom_scale,
             "simulation_mode": self.scene.simulation_mode,
             "house_built": self.scene.house_built
@@ -383,7 +490,8 @@ class ArcadeEventHandler:
 
     def handle_window_resize(self, width, height):
         """Handle window resize events"""
-        print(f"[ArcadeEventHandler] Window resized to {width}x{height}")
+        if getattr(self.scene, 'debug_mode', False):
+            print(f"[ArcadeEventHandler] Window resized to {width}x{height}")
         # Update camera if needed
         if self.scene.camera:
             self.scene.camera.resize(width, height)
@@ -407,12 +515,14 @@ class ArcadeEventHandler:
 
     def create_context_menu(self, x, y):
         """Create context menu at position (placeholder for future enhancement)"""
-        print(f"[ArcadeEventHandler] Context menu requested at ({x}, {y})")
+        if getattr(self.scene, 'debug_mode', False):
+            print(f"[ArcadeEventHandler] Context menu requested at ({x}, {y})")
         # Could implement actual context menu here
         return None
 
     def handle_hotkey(self, key_combination):
         """Handle hotkey combinations"""
-        print(f"[ArcadeEventHandler] Hotkey pressed: {key_combination}")
+        if getattr(self.scene, 'debug_mode', False):
+            print(f"[ArcadeEventHandler] Hotkey pressed: {key_combination}")
         # Could implement hotkey system here
         pass
\ No newline at end of file
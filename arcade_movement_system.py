@@ -154,14 +154,12 @@ class ArcadeMovementSystem:
         if moving_bipeds:
             print(f"[ArcadeMovementSystem] Simulating movement for {len(moving_bipeds)} bipeds")
             
-            for biped, time_away in moving_bipeds:
-                unit_id = getattr(biped, 'unit_id', 'unknown')
-                print(f"[ArcadeMovementSystem] Simulating {time_away:.1f}s of movement for {unit_id}")
-                
-                # Simulate the movement progress
-                if hasattr(self.scene, 'entity_manager'):
-                    result = self.scene.entity_manager.simulate_movement_progress(biped, time_away)
-                    print(f"[ArcadeMovementSystem] Simulation result for {unit_id}: {result}")
+            # Simulate the movement progress for every biped in one batch
+            if hasattr(self.scene, 'entity_manager'):
+                results = self.scene.entity_manager.simulate_movement_progress_bulk(moving_bipeds)
+                for (biped, time_away), result in zip(moving_bipeds, results):
+                    unit_id = getattr(biped, 'unit_id', 'unknown')
+                    print(f"[ArcadeMovementSystem] Simulated {time_away:.1f}s of movement for {unit_id}: {result}")
 
     def validate_movement_state(self):
         """Validate and fix any movement state issues"""
@@ -51,8 +51,11 @@ class ArcadePlanetScene(arcade.View):
         
         # Sprite lists for efficient rendering
         self.terrain_sprites = arcade.SpriteList()
-        self.animal_sprites = arcade.SpriteList()
-        self.biped_sprites = arcade.SpriteList()
+        # Animals and bipeds move every frame, so no spatial hash; lazy
+        # defers their GPU buffers until the list itself is first drawn
+        self.animal_sprites = arcade.SpriteList(use_spatial_hash=False, lazy=True)
+        self.animals_version = 0  # Bumped whenever animal_sprites changes
+        self.biped_sprites = arcade.SpriteList(use_spatial_hash=False, lazy=True)
         self.tree_sprites = arcade.SpriteList()
         self.house_sprites = arcade.SpriteList()
         self.drop_sprites = arcade.SpriteList()
@@ -67,6 +70,14 @@ class ArcadePlanetScene(arcade.View):
             self.drop_sprites
         ]
         
+        # Lists whose sprites have per-frame update logic. Terrain, tree,
+        # house and drop sprites never move, so their update() is a no-op
+        # and ticking them every frame is wasted work.
+        self.active_sprite_lists = [
+            self.animal_sprites,
+            self.biped_sprites
+        ]
+        
         # Terrain data
         self.terrain_width = meta.tiles[0]
         self.terrain_height = meta.tiles[1]
@@ -74,8 +85,10 @@ class ArcadePlanetScene(arcade.View):
         
         # Game state
         self.blocked_tiles = set()
+        self.blocked_version = 0  # Bumped whenever blocked_tiles changes
         self.tree_tiles = set()
         self.drops = []
+        self.drops_version = 0  # Bumped whenever drops changes
         self.inventory = {}
         self.wave_time = 0.0
         self.wave_speed = 5.0
@@ -86,9 +99,11 @@ class ArcadePlanetScene(arcade.View):
         self.mouse_dragging = False
         self.last_mouse_x = 0
         self.last_mouse_y = 0
+        self.event_handler = None  # ArcadeEventHandler attached to this scene, if any
         
-        # Auto-save tracking
-        self._last_auto_save = time.time()
+        # Auto-save tracking; the entity and state managers both debounce
+        # on this monotonic stamp
+        self._last_auto_save_ns = time.monotonic_ns()
         self._last_validation = time.time()
         self._last_cleanup = time.time()
         
@@ -192,6 +207,7 @@ class ArcadePlanetScene(arcade.View):
             animal = ArcadeAnimalSprite(iso_x, iso_y)
             animal.parent = self
             self.animal_sprites.append(animal)
+        self.animals_version += 1
             
         # Spawn some bipeds
         for i in range(3):
@@ -296,10 +312,14 @@ class ArcadePlanetScene(arcade.View):
         # Update wave animation time
         self.wave_time += delta_time * 0.001
         
-        # Update all sprite lists
-        for sprite_list in self.sprite_lists:
+        # Update the sprite lists that have per-frame logic
+        for sprite_list in self.active_sprite_lists:
             sprite_list.update()
         
+        # Once-per-frame input work, e.g. the coalesced drop hover pass
+        if self.event_handler is not None:
+            self.event_handler.on_update(delta_time)
+        
         # Simple cleanup check
         if time.time() - self._last_cleanup > 30.0:
             self._cleanup_dead_entities()
@@ -441,6 +461,7 @@ class ArcadePlanetScene(arcade.View):
         # Clear all sprites
         for sprite_list in self.sprite_lists:
             sprite_list.clear()
+        self.animals_version += 1
         
         # Regenerate
         self._generate_new_world()
@@ -453,6 +474,7 @@ class ArcadePlanetScene(arcade.View):
             dead_sprites = [s for s in sprite_list if hasattr(s, 'alive') and not s.alive]
             for sprite in dead_sprites:
                 sprite_list.remove(sprite)
+        self.animals_version += 1
 
     ##########################################################
     # State Management (Simplified)
@@ -665,6 +687,15 @@ class ArcadeTerrainSprite(arcade.Sprite):
 class ArcadeAnimalSprite(arcade.Sprite):
     """Animal sprite for Arcade"""
     
+    # Simulation state read every frame by ArcadeAnimalManager
+    __slots__ = (
+        'alive', 'grid_x', 'grid_y', 'species_id', 'creation_time',
+        'last_move_time', 'move_cooldown', 'territory_center_x',
+        'territory_center_y', 'territory_radius', 'diet', 'aggression',
+        'health', 'max_health', 'energy', 'reproduction_cooldown',
+        'has_vitals', 'parent',
+    )
+    
     def __init__(self, x: float, y: float, color=(255, 165, 0)):
         super().__init__()
         self.center_x = x
@@ -672,6 +703,25 @@ class ArcadeAnimalSprite(arcade.Sprite):
         self.color = color
         self.alive = True
         self.radius = 10
+        
+        # Defaults for sprites not set up by ArcadeAnimalManager; those
+        # have no territory (None) and no energy/health simulation
+        self.grid_x = 0
+        self.grid_y = 0
+        self.species_id = 0
+        self.creation_time = 0
+        self.last_move_time = 0
+        self.move_cooldown = 3.0
+        self.territory_center_x = None
+        self.territory_center_y = None
+        self.territory_radius = 5
+        self.diet = "unknown"
+        self.aggression = 0.0
+        self.health = 100
+        self.max_health = 100
+        self.energy = 100
+        self.reproduction_cooldown = 0
+        self.has_vitals = False
 
     def update(self, delta_time: float = 0.0):
         """Update animal behavior"""
@@ -706,6 +756,16 @@ class ArcadeAnimalSprite(arcade.Sprite):
 class ArcadeBipedSprite(arcade.Sprite):
     """Biped (unit) sprite for Arcade"""
     
+    # Unit state attached by the entity, unit and state managers
+    __slots__ = (
+        'name', 'alive', 'selected', '_mission', 'moving', 'target_x',
+        'target_y', 'grid_x', 'grid_y', 'unit_id', 'creation_time',
+        'last_command_time', 'health', 'mission_data', 'speed', 'parent',
+    )
+    
+    # Bumped on every mission change, so tallies can be cached until then
+    mission_epoch = 0
+    
     def __init__(self, x: float, y: float, name: str, color=(0, 255, 0)):
         super().__init__()
         self.center_x = x
@@ -716,6 +776,20 @@ class ArcadeBipedSprite(arcade.Sprite):
         self.selected = False
         self.width = 16
         self.height = 24
+        self._mission = "IDLE"
+        # Movement state always exists so per-frame loops can read it directly
+        self.moving = False
+        self.target_x = 0.0
+        self.target_y = 0.0
+
+    @property
+    def mission(self):
+        return self._mission
+
+    @mission.setter
+    def mission(self, value):
+        self._mission = value
+        ArcadeBipedSprite.mission_epoch += 1
 
     def update(self, delta_time: float = 0.0):
         """Update biped behavior"""
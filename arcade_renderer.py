@@ -117,8 +117,7 @@ class ArcadeRenderer:
                 )
             
             # Draw movement target if moving
-            if (hasattr(biped, 'moving') and biped.moving and
-                hasattr(biped, 'target_x') and hasattr(biped, 'target_y')):
+            if biped.moving:
                 # Draw target indicator
                 arcade.draw_circle_filled(
                     biped.target_x, biped.target_y, 5,
@@ -6,6 +6,8 @@
 import time
 import arcade
 
+from arcade_utilities import AUTO_SAVE_INTERVAL_NS, filled_texture
+
 class ArcadeStateManager:
     """Handles all state serialization, loading, and persistence for Arcade"""
     
@@ -242,8 +244,8 @@ class ArcadeStateManager:
             biped.unit_id = biped_info.get("unit_id", f"biped_{hash(biped)}")
             biped.mission = biped_info.get("mission", "IDLE")
             biped.moving = biped_info.get("moving", False)
-            biped.target_x = biped_info.get("target_x")
-            biped.target_y = biped_info.get("target_y")
+            biped.target_x = biped_info.get("target_x") or 0.0
+            biped.target_y = biped_info.get("target_y") or 0.0
             biped.health = biped_info.get("health", 100)
             biped.creation_time = biped_info.get("creation_time", time.time())
             biped.last_command_time = biped_info.get("last_command_time", time.time())
@@ -272,6 +274,7 @@ class ArcadeStateManager:
             animal.species_id = animal_info.get("species_id", 0)
             
             self.scene.animal_sprites.append(animal)
+        self.scene.animals_version += 1
         
         print(f"[ArcadeStateManager] Loaded {len(self.scene.animal_sprites)} animals")
 
@@ -336,10 +339,12 @@ class ArcadeStateManager:
             drop.center_y = drop_info["center_y"]
             drop.resource_type = drop_info.get("resource_type", "unknown")
             drop.quantity = drop_info.get("quantity", 1)
-            drop.texture = arcade.Texture.create_filled("drop", (16, 16), arcade.color.GOLD)
+            drop.hovered = False
+            drop.texture = filled_texture("drop", (16, 16), arcade.color.GOLD)
             
             self.scene.drop_sprites.append(drop)
             self.scene.drops.append(drop)
+        self.scene.drops_version += 1
         
         print(f"[ArcadeStateManager] Loaded {len(self.scene.drops)} drops")
 
@@ -350,6 +355,7 @@ class ArcadeStateManager:
         # Load blocked tiles
         blocked_tiles_list = game_state.get("blocked_tiles", [])
         self.scene.blocked_tiles = set(tuple(pos) for pos in blocked_tiles_list)
+        self.scene.blocked_version += 1
         
         # Load tree tiles
         tree_tiles_list = game_state.get("tree_tiles", [])
@@ -374,13 +380,12 @@ class ArcadeStateManager:
     def auto_save(self, reason="unknown"):
         """Trigger auto-save"""
         try:
-            # Throttle auto-saves
-            if hasattr(self.scene, '_last_auto_save'):
-                time_since_save = time.time() - self.scene._last_auto_save
-                if time_since_save < 5.0:  # Don't save more than once every 5 seconds
-                    return
+            # Throttle auto-saves, sharing the entity manager's clock
+            now = time.monotonic_ns()
+            if now - self.scene._last_auto_save_ns < AUTO_SAVE_INTERVAL_NS:
+                return  # Don't save more than once every 5 seconds
             
-            self.scene._last_auto_save = time.time()
+            self.scene._last_auto_save_ns = now
             
             if self.scene.planet_storage and hasattr(self.scene, 'meta'):
                 self.scene.meta.state = self.serialize_state()
@@ -395,10 +400,12 @@ class ArcadeStateManager:
 
     def get_save_info(self):
         """Get information about the current save state"""
+        # Wall-clock time of the last auto-save, recovered from its monotonic stamp
+        since_save = (time.monotonic_ns() - self.scene._last_auto_save_ns) / 1e9
         return {
             "has_save_data": hasattr(self.scene, 'meta') and self.scene.meta.state is not None,
             "planet_id": getattr(self.scene, 'planet_id', None),
-            "last_save_time": getattr(self.scene, '_last_auto_save', None),
+            "last_save_time": time.time() - since_save,
             "engine": "arcade",
             "format_version": 1
         }
@@ -118,30 +118,22 @@ class ArcadeUnitManager:
     def _update_unit(self, unit, dt):
         """Update individual unit"""
         # Handle movement
-        if hasattr(unit, 'moving') and unit.moving:
-            if hasattr(unit, 'target_x') and hasattr(unit, 'target_y'):
-                # Calculate movement
-                dx = unit.target_x - unit.center_x
-                dy = unit.target_y - unit.center_y
-                distance = math.hypot(dx, dy)
-                
-                if distance > 2:  # Still moving
-                    speed = 50 * dt  # pixels per second
-                    unit.center_x += (dx / distance) * speed
-                    unit.center_y += (dy / distance) * speed
-                else:
-                    # Reached target
-                    unit.center_x = unit.target_x
-                    unit.center_y = unit.target_y
-                    unit.moving = False
-                    if hasattr(unit, 'mission'):
-                        unit.mission = "IDLE"
-                    
-                    # Clean up movement properties
-                    if hasattr(unit, 'target_x'):
-                        delattr(unit, 'target_x')
-                    if hasattr(unit, 'target_y'):
-                        delattr(unit, 'target_y')
+        if unit.moving:
+            # Calculate movement
+            dx = unit.target_x - unit.center_x
+            dy = unit.target_y - unit.center_y
+            distance = math.hypot(dx, dy)
+            
+            if distance > 2:  # Still moving
+                speed = 50 * dt  # pixels per second
+                unit.center_x += (dx / distance) * speed
+                unit.center_y += (dy / distance) * speed
+            else:
+                # Reached target; the stale target is ignored while not moving
+                unit.center_x = unit.target_x
+                unit.center_y = unit.target_y
+                unit.moving = False
+                unit.mission = "IDLE"
 
     def get_unit_count(self):
         """Get total number of units"""
@@ -184,12 +176,7 @@ class ArcadeUnitManager:
         """Cancel a unit's current mission"""
         if hasattr(unit, 'mission'):
             unit.mission = "IDLE"
-        if hasattr(unit, 'moving'):
-            unit.moving = False
-        if hasattr(unit, 'target_x'):
-            delattr(unit, 'target_x')
-        if hasattr(unit, 'target_y'):
-            delattr(unit, 'target_y')
+        unit.moving = False
         
         print(f"[ArcadeUnitManager] Cancelled mission for unit {getattr(unit, 'name', 'Unknown')}")
 
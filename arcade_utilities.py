@@ -14,6 +14,21 @@ TILE_DESERT = 11
 TILE_WIDTH = 64
 TILE_HEIGHT = 37
 
+# Minimum gap between auto-saves, in monotonic nanoseconds; both the
+# entity and state managers debounce on the scene's _last_auto_save_ns
+AUTO_SAVE_INTERVAL_NS = 5_000_000_000
+
+# Solid-colour textures by (name, size, colour); each is built once
+_FILLED_TEXTURES = {}
+
+def filled_texture(name, size, color):
+    """Shared solid-colour texture, created on first use"""
+    key = (name, tuple(size), tuple(color))
+    texture = _FILLED_TEXTURES.get(key)
+    if texture is None:
+        texture = _FILLED_TEXTURES[key] = arcade.Texture.create_filled(name, size, color)
+    return texture
+
 class ArcadeUtilities:
     """Collection of utility functions for Arcade planet scene operations"""
     
@@ -339,6 +354,7 @@ class ArcadeUtilities:
                 blocked.add((house_sprite.grid_x, house_sprite.grid_y))
         
         self.scene.blocked_tiles = blocked
+        self.scene.blocked_version += 1
         print(f"[ArcadeUtilities] Optimized blocked tiles: {len(blocked)} total")
 
     def cleanup_dead_entities(self):
@@ -354,9 +370,11 @@ class ArcadeUtilities:
             dead_sprites = [s for s in sprite_list if hasattr(s, 'alive') and not s.alive]
             for sprite in dead_sprites:
                 sprite_list.remove(sprite)
+        self.scene.animals_version += 1
         
         # Clean up drops list
         self.scene.drops = [d for d in self.scene.drops if getattr(d, 'alive', True)]
+        self.scene.drops_version += 1
         
         # Log cleanup results
         final_counts = {
@@ -372,13 +390,13 @@ class ArcadeUtilities:
 
     def create_simple_texture(self, name, size, color):
         """Create a simple filled texture"""
-        return arcade.Texture.create_filled(name, size, color)
+        return filled_texture(name, size, color)
 
     def create_diamond_texture(self, name, size, color):
         """Create a diamond-shaped texture for isometric tiles"""
         # For now, just create a filled texture
         # In a full implementation, this would create an actual diamond shape
-        return arcade.Texture.create_filled(name, size, color)
+        return filled_texture(name, size, color)
 
     def get_sprite_at_position(self, screen_x, screen_y, sprite_list):
         """Get sprite at screen position from a sprite list"""
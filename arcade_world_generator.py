@@ -7,6 +7,8 @@ import random
 import math
 import arcade
 
+from arcade_utilities import filled_texture
+
 # Constants
 TILE_WATER = 2
 TILE_WATERSTACK = 5
@@ -179,6 +181,7 @@ class ArcadeWorldGenerator:
             (x, y) for y in range(planet_h) for x in range(planet_w)
             if self.scene.map_data[y][x] in (TILE_WATER, TILE_WATERSTACK, TILE_MOUNTAIN)
         }
+        self.scene.blocked_version += 1
         
         print(f"[ArcadeWorldGenerator] Found {len(valid)} valid tiles, {len(self.scene.valid_spawn_tiles)} spawn tiles")
 
@@ -207,6 +210,7 @@ class ArcadeWorldGenerator:
                     self.scene.blocked_tiles.add((x, y))
                     break
                 attempts += 1
+        self.scene.blocked_version += 1
         
         print(f"[ArcadeWorldGenerator] Generated {len(self.scene.tree_sprites)} trees")
 
@@ -226,4 +230,4 @@ class ArcadeTreeSprite(arcade.Sprite):
         self.center_y = y
         
         # Create a simple tree texture (green circle on brown rectangle)
-        self.texture = arcade.Texture.create_filled("tree", (32, 48), (34, 139, 34))  # Green
\ No newline at end of file
+        self.texture = filled_texture("tree", (32, 48), (34, 139, 34))  # Green
\ No newline at end of file
@@ -44,6 +44,12 @@ class EntityStats:
 class Entity:
     """Base class for all game entities"""
     
+    __slots__ = (
+        'entity_id', 'entity_type', 'x', 'y', 'target_x', 'target_y',
+        'state', 'stats', 'path', 'path_index', 'animation_frame',
+        'animation_timer', 'color', 'size', 'selected',
+    )
+    
     def __init__(self, entity_id: str, entity_type: EntityType, x: float, y: float):
         self.entity_id = entity_id
         self.entity_type = entity_type
@@ -220,6 +220,7 @@ class PlanetEventHandler:
         self.scene.houses.append(house)
         self.scene.iso_objects.append(house)
         self.scene.blocked_tiles.add((gx, gy))
+        self.scene.movement_system.invalidate_path_cache()
         self.scene.house_built = True
         print(f"House built at {gx}, {gy}")
 
@@ -6,12 +6,19 @@
 import math
 import heapq
 import time
+from collections import OrderedDict
+
+# Maximum number of (start, goal) results kept by find_path_cached
+PATH_CACHE_SIZE = 4096
 
 class PlanetMovementSystem:
     """Handles all pathfinding and movement simulation"""
     
     def __init__(self, scene):
         self.scene = scene
+        self.path_version = 0
+        self._path_cache = OrderedDict()
+        self._path_cache_key = None
 
     def find_path(self, sx, sy, gx, gy):
         """Enhanced pathfinding with height awareness"""
@@ -20,6 +27,38 @@ class PlanetMovementSystem:
         else:
             return self._a_star_path(sx, sy, gx, gy)
 
+    def invalidate_path_cache(self):
+        """Drop cached paths after the walkable map changes"""
+        self.path_version += 1
+
+    def find_path_cached(self, sx, sy, gx, gy):
+        """
+        find_path with an LRU cache keyed on (start, goal) tiles.
+        The cache is flushed whenever the path version is bumped or the
+        blocked set / map is replaced or changes size.
+        """
+        scene = self.scene
+        blocked = scene.blocked_tiles
+        key = (self.path_version, id(blocked), len(blocked),
+               id(scene.map), scene.use_layered_terrain)
+        cache = self._path_cache
+        if key != self._path_cache_key:
+            cache.clear()
+            self._path_cache_key = key
+
+        tiles = (sx, sy, gx, gy)
+        if tiles in cache:
+            cache.move_to_end(tiles)
+            path = cache[tiles]
+        else:
+            path = self.find_path(sx, sy, gx, gy)
+            cache[tiles] = path
+            if len(cache) > PATH_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        # Hand out copies so callers can't corrupt the cached path
+        return list(path) if path is not None else None
+
     def _a_star_path_layered(self, sx, sy, gx, gy):
         """A* pathfinding that considers terrain height"""
         if (gx, gy) in self.scene.blocked_tiles or (sx, sy) == (gx, gy):
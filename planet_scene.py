@@ -169,6 +169,10 @@ class PlanetScene(Scene):
         """Find path between two points using movement system"""
         return self.movement_system.find_path(sx, sy, gx, gy)
 
+    def find_path_cached(self, sx, sy, gx, gy):
+        """Find path between two points, reusing recent results"""
+        return self.movement_system.find_path_cached(sx, sy, gx, gy)
+
     def is_water_tile(self, gx: int, gy: int) -> bool:
         """Check if tile is water using utilities"""
         return self.utilities.is_water_tile(gx, gy)
@@ -0,0 +1,171 @@
+##########################################################
+# spatial_index.py
+# Spatial indexes (Z-order, hash grid) for proximity queries
+##########################################################
+
+import math
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+
+# Grid coordinates are clamped to 16 bits per axis before interleaving
+COORD_MAX = 0xFFFF
+
+_z_key = itemgetter(0)
+
+
+def _part1by1(v):
+    """Spread the low 16 bits of v so a zero bit sits between each of them"""
+    v &= 0x0000FFFF
+    v = (v | (v << 8)) & 0x00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F
+    v = (v | (v << 2)) & 0x33333333
+    v = (v | (v << 1)) & 0x55555555
+    return v
+
+
+def _grid(v):
+    """Clamp a float tile coordinate to an unsigned 16-bit grid cell"""
+    g = int(v)
+    if g < 0:
+        return 0
+    if g > COORD_MAX:
+        return COORD_MAX
+    return g
+
+
+def morton_encode(gx, gy):
+    """Interleave two 16-bit grid coordinates into a single z-value"""
+    return _part1by1(gx) | (_part1by1(gy) << 1)
+
+
+class ZOrderIndex:
+    """
+    Snapshot of entity positions sorted by z-value.
+    Rebuilt once per tick; queries binary-search the z-range covering the
+    query box and reject entries that fall outside it.
+    """
+
+    def __init__(self):
+        self._zs = []
+        self._entries = []
+
+    def __len__(self):
+        return len(self._entries)
+
+    def rebuild(self, items):
+        """Index every object in items by its (x_f, y_f) position"""
+        entries = []
+        append = entries.append
+        for ref in items:
+            x, y = ref.x_f, ref.y_f
+            gx, gy = _grid(x), _grid(y)
+            append((morton_encode(gx, gy), gx, gy, x, y, ref))
+        entries.sort(key=_z_key)
+        self._entries = entries
+        self._zs = [e[0] for e in entries]
+
+    def nearest(self, x, y, max_dist, accept=None):
+        """
+        Return the closest indexed object strictly within max_dist of (x, y)
+        for which accept(obj) is true, or None.
+        """
+        gx0, gy0 = _grid(x - max_dist), _grid(y - max_dist)
+        gx1, gy1 = _grid(x + max_dist), _grid(y + max_dist)
+
+        zs = self._zs
+        lo = bisect_left(zs, morton_encode(gx0, gy0))
+        hi = bisect_right(zs, morton_encode(gx1, gy1), lo)
+
+        best = None
+        best_d2 = max_dist * max_dist
+        entries = self._entries
+        for i in range(lo, hi):
+            _, gx, gy, ex, ey, ref = entries[i]
+            # The z-range also covers cells outside the box; skip those
+            if gx < gx0 or gx > gx1 or gy < gy0 or gy > gy1:
+                continue
+            dx = ex - x
+            dy = ey - y
+            d2 = dx * dx + dy * dy
+            if d2 < best_d2 and (accept is None or accept(ref)):
+                best = ref
+                best_d2 = d2
+        return best
+
+
+class SpatialHashGrid:
+    """
+    Uniform hash grid bucketing objects by the tile-grid cell containing
+    their (grid_x, grid_y). Callers keep it in step with position changes
+    through insert / remove / move, or rebuild it wholesale.
+    """
+
+    def __init__(self, cell_size=4):
+        self.cell_size = cell_size
+        self._grid = {}
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def _key(self, gx, gy):
+        cell = self.cell_size
+        return (gx // cell, gy // cell)
+
+    def rebuild(self, items):
+        """Re-bucket every object in items"""
+        self._grid = {}
+        self._count = 0
+        for obj in items:
+            self.insert(obj)
+
+    def insert(self, obj):
+        key = self._key(getattr(obj, 'grid_x', 0), getattr(obj, 'grid_y', 0))
+        self._grid.setdefault(key, []).append(obj)
+        self._count += 1
+
+    def remove(self, obj, xy=None):
+        """Remove obj, bucketed at xy (defaults to its current grid position)"""
+        if xy is None:
+            xy = (getattr(obj, 'grid_x', 0), getattr(obj, 'grid_y', 0))
+        key = self._key(*xy)
+        bucket = self._grid.get(key)
+        if bucket is None:
+            return
+        for i, other in enumerate(bucket):
+            if other is obj:
+                bucket[i] = bucket[-1]
+                bucket.pop()
+                self._count -= 1
+                break
+        if not bucket:
+            del self._grid[key]
+
+    def move(self, obj, old_xy, new_xy):
+        """Re-bucket obj after its grid position changed from old_xy to new_xy"""
+        if self._key(*old_xy) == self._key(*new_xy):
+            return
+        self.remove(obj, old_xy)
+        self._grid.setdefault(self._key(*new_xy), []).append(obj)
+        self._count += 1
+
+    def query_cell(self, gx, gy):
+        """Objects bucketed in the cell containing tile (gx, gy)"""
+        return self._grid.get(self._key(gx, gy), ())
+
+    def query_radius(self, cx, cy, r):
+        """Objects in every cell overlapping the square of half-size r around (cx, cy)"""
+        kx0, ky0 = self._key(int(math.floor(cx - r)), int(math.floor(cy - r)))
+        kx1, ky1 = self._key(int(math.floor(cx + r)), int(math.floor(cy + r)))
+        grid = self._grid
+        # Sparse grids: walking the occupied cells beats walking a huge box
+        if (kx1 - kx0 + 1) * (ky1 - ky0 + 1) > len(grid):
+            for (kx, ky), bucket in grid.items():
+                if kx0 <= kx <= kx1 and ky0 <= ky <= ky1:
+                    yield from bucket
+            return
+        for ky in range(ky0, ky1 + 1):
+            for kx in range(kx0, kx1 + 1):
+                bucket = grid.get((kx, ky))
+                if bucket:
+                    yield from bucket
@@ -0,0 +1,45 @@
+##########################################################
+# test_arcade_animals.py
+# Index bookkeeping checks for ArcadeAnimalManager
+##########################################################
+
+import types
+
+import pytest
+
+pytest.importorskip("arcade")
+
+from arcade_animals import ArcadeAnimalManager
+
+MAP_SIZE = 30
+
+def _make_manager(count=5):
+    """Manager over an all-grass map with count random animals"""
+    scene = types.SimpleNamespace(
+        animal_sprites=[],
+        animals_version=0,
+        terrain_width=MAP_SIZE,
+        terrain_height=MAP_SIZE,
+        map_data=[[0] * MAP_SIZE for _ in range(MAP_SIZE)],
+        blocked_tiles=set(),
+    )
+    manager = ArcadeAnimalManager(scene)
+    manager.spawn_random_animals(count)
+    return manager, scene
+
+def test_same_length_swap_reindexes():
+    """Replacing a sprite behind the manager's back, keeping the list length, is picked up"""
+    manager, scene = _make_manager()
+    old = scene.animal_sprites[0]
+    new = manager._create_random_animal(10, 10)
+    scene.animal_sprites[0] = new
+    scene.animals_version += 1
+
+    found = manager.get_animals_in_area(10, 10, 0.5)
+    assert new in found
+    assert old not in found
+
+    by_species = manager.get_animals_by_species()
+    assert new in by_species[new.species_id]
+    assert old.species_id not in by_species
+    assert manager.get_animal_stats()["species_count"] == len(scene.animal_sprites)